@@ -1,13 +1,16 @@
 """Captive portal endpoints for automatic phone connection."""
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse, PlainTextResponse, RedirectResponse
+from urllib.parse import quote, urlsplit
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.session import Session, SessionStatus
+from app.services import active_session_cache
 
 router = APIRouter()
 
@@ -179,6 +182,41 @@ PORTAL_HTML_WAITING = """
 </html>
 """
 
+# Pre-encoded templates - the active page is split around each SESSION_URL
+# placeholder so rendering is a single bytes join instead of replace + encode
+_ACTIVE_SEGMENTS = [s.encode("utf-8") for s in PORTAL_HTML_ACTIVE.split("SESSION_URL")]
+_WAITING_BYTES = PORTAL_HTML_WAITING.encode("utf-8")
+_SESSION_URL_FMT = settings.public_url + "/session/%s"
+
+# Static probe bodies, encoded once at import
+_APPLE_SUCCESS_BODY = b"<HTML><HEAD><TITLE>Success</TITLE></HEAD><BODY>Success</BODY></HTML>"
+_WINDOWS_CONNECT_TEST_BODY = b"Microsoft Connect Test"
+_WINDOWS_NCSI_BODY = b"Microsoft NCSI"
+_SUCCESS_TXT_BODY = b"success"
+
+# Success page that also tries to open the session after the portal closes.
+# The redirect is URL-quoted before substitution so it can't break out of
+# the attribute or JS string literals.
+_SUCCESS_REDIRECT_TMPL = b"""<HTML>
+<HEAD>
+<TITLE>Success</TITLE>
+<meta http-equiv="refresh" content="0;url=%b">
+</HEAD>
+<BODY>
+Success
+<script>
+    // Try multiple methods to open the session
+    window.location.href = "%b";
+    setTimeout(function() { window.open("%b", "_blank"); }, 100);
+</script>
+</BODY>
+</HTML>"""
+
+
+def _render_active_portal(session_url: str) -> bytes:
+    """Render the active portal page with the session URL filled in."""
+    return session_url.encode("utf-8").join(_ACTIVE_SEGMENTS)
+
 
 @router.get("/generate_204")
 async def android_captive_check():
@@ -186,7 +224,7 @@ async def android_captive_check():
     Android captive portal detection.
     Return 204 = "internet works" = no popup, stay connected.
     """
-    return PlainTextResponse("", status_code=204)
+    return Response(status_code=204)
 
 
 @router.get("/hotspot-detect.html")
@@ -195,13 +233,13 @@ async def apple_captive_check():
     Apple/iOS captive portal detection.
     Return Success = no popup, stay connected.
     """
-    return HTMLResponse("<HTML><HEAD><TITLE>Success</TITLE></HEAD><BODY>Success</BODY></HTML>")
+    return Response(content=_APPLE_SUCCESS_BODY, media_type="text/html")
 
 
 @router.get("/library/test/success.html")
 async def apple_captive_check_alt():
     """Alternative Apple captive portal check URL."""
-    return HTMLResponse("<HTML><HEAD><TITLE>Success</TITLE></HEAD><BODY>Success</BODY></HTML>")
+    return Response(content=_APPLE_SUCCESS_BODY, media_type="text/html")
 
 
 @router.get("/connecttest.txt")
@@ -210,13 +248,13 @@ async def windows_captive_check():
     Windows captive portal detection.
     Return expected response = no popup, stay connected.
     """
-    return PlainTextResponse("Microsoft Connect Test")
+    return Response(content=_WINDOWS_CONNECT_TEST_BODY, media_type="text/plain")
 
 
 @router.get("/ncsi.txt")
 async def windows_ncsi_check():
     """Windows NCSI check."""
-    return PlainTextResponse("Microsoft NCSI")
+    return Response(content=_WINDOWS_NCSI_BODY, media_type="text/plain")
 
 
 @router.get("/captive-success")
@@ -225,23 +263,12 @@ async def captive_success(redirect: str = None):
     Success endpoint that tells iOS/Android the captive portal is complete.
     If redirect is provided, attempts to open that URL after closing portal.
     """
-    if redirect:
+    if redirect and urlsplit(redirect).scheme in ("http", "https"):
         # Return success page that also tries to redirect
-        return HTMLResponse(f"""<HTML>
-<HEAD>
-<TITLE>Success</TITLE>
-<meta http-equiv="refresh" content="0;url={redirect}">
-</HEAD>
-<BODY>
-Success
-<script>
-    // Try multiple methods to open the session
-    window.location.href = "{redirect}";
-    setTimeout(function() {{ window.open("{redirect}", "_blank"); }}, 100);
-</script>
-</BODY>
-</HTML>""")
-    return HTMLResponse("<HTML><HEAD><TITLE>Success</TITLE></HEAD><BODY>Success</BODY></HTML>")
+        quoted = quote(redirect, safe=":/?=&#%").encode("ascii")
+        body = _SUCCESS_REDIRECT_TMPL % (quoted, quoted, quoted)
+        return Response(content=body, media_type="text/html")
+    return Response(content=_APPLE_SUCCESS_BODY, media_type="text/html")
 
 
 @router.get("/redirect")
@@ -250,9 +277,41 @@ async def generic_redirect():
     return RedirectResponse(url="/portal", status_code=302)
 
 
+async def _get_active_session_id(db: AsyncSession) -> str | None:
+    """Get the current active session id, coalescing concurrent lookups."""
+    hit, session_id = active_session_cache.get()
+    if hit:
+        return session_id
+
+    async with active_session_cache.lock:
+        # Another request may have refreshed the cache while we waited
+        hit, session_id = active_session_cache.get()
+        if hit:
+            return session_id
+
+        generation = active_session_cache.generation
+
+        # Look for the current active session
+        result = await db.execute(
+            select(Session.id)
+            .where(Session.status.in_([
+                SessionStatus.ACTIVE.value,
+                SessionStatus.CAPTURING.value,
+                SessionStatus.COUNTDOWN.value,
+            ]))
+            .order_by(Session.created_at.desc())
+            .limit(1)
+        )
+        session_id = result.scalar_one_or_none()
+
+        # Not cached if the cache was invalidated while the query ran
+        active_session_cache.store(session_id, generation)
+
+        return session_id
+
+
 @router.get("/portal", response_class=HTMLResponse)
 async def captive_portal_page(
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -262,27 +321,15 @@ async def captive_portal_page(
     It checks for an active session and either shows a join button
     or a waiting message.
     """
-    # Look for the current active session
-    result = await db.execute(
-        select(Session)
-        .where(Session.status.in_([
-            SessionStatus.ACTIVE.value,
-            SessionStatus.CAPTURING.value,
-            SessionStatus.COUNTDOWN.value,
-        ]))
-        .order_by(Session.created_at.desc())
-        .limit(1)
-    )
-    active_session = result.scalar_one_or_none()
-
-    if active_session:
-        session_url = f"{settings.public_url}/session/{active_session.id}"
-        # Replace all occurrences of SESSION_URL
-        html = PORTAL_HTML_ACTIVE.replace("SESSION_URL", session_url)
+    active_session_id = await _get_active_session_id(db)
+
+    # Gzip (and the Vary header) is left to the app-wide TextGZipMiddleware
+    if active_session_id:
+        body = _render_active_portal(_SESSION_URL_FMT % active_session_id)
     else:
-        html = PORTAL_HTML_WAITING
+        body = _WAITING_BYTES
 
-    return HTMLResponse(content=html)
+    return Response(content=body, media_type="text/html; charset=utf-8")
 
 
 @router.get("/success.txt")
@@ -293,11 +340,11 @@ async def success_check():
     Some systems check for this to verify internet connectivity.
     We return "success" to prevent constant redirects after initial portal.
     """
-    return PlainTextResponse("success")
+    return Response(content=_SUCCESS_TXT_BODY, media_type="text/plain")
 
 
 # Catch-all for unknown captive portal checks
 @router.get("/favicon.ico")
 async def favicon():
     """Return empty favicon to prevent 404s."""
-    return PlainTextResponse("", status_code=204)
+    return Response(status_code=204)
@@ -1,9 +1,13 @@
 """Photo endpoints for viewing and downloading."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+import asyncio
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.db.session import get_db
@@ -14,6 +18,9 @@ from app.services import get_storage_service
 
 router = APIRouter()
 
+# Download filename: picpop_<session prefix>_<sequence>.jpg
+_DOWNLOAD_NAME_FMT = "picpop_%s_%02d.jpg"
+
 
 @router.get("/{session_id}/photos", response_model=list[PhotoResponse])
 async def list_session_photos(
@@ -21,7 +28,11 @@ async def list_session_photos(
     db: AsyncSession = Depends(get_db),
 ) -> list[PhotoResponse]:
     """List all photos for a session."""
-    result = await db.execute(select(Session).where(Session.id == session_id))
+    result = await db.execute(
+        select(Session)
+        .options(selectinload(Session.photos))
+        .where(Session.id == session_id)
+    )
     session = result.scalar_one_or_none()
 
     if not session:
@@ -30,34 +41,21 @@ async def list_session_photos(
             detail="Session not found",
         )
 
-    photos_result = await db.execute(
-        select(Photo)
-        .where(Photo.session_id == session_id)
-        .order_by(Photo.sequence)
-    )
-    photos = photos_result.scalars().all()
-
-    storage = get_storage_service()
-
-    return [
-        PhotoResponse(
-            id=photo.id,
-            sessionId=photo.session_id,
-            sequence=photo.sequence,
-            capturedAt=photo.captured_at,
-            webUrl=storage.get_photo_url(photo.web_path),
-            thumbnailUrl=storage.get_photo_url(photo.thumbnail_path),
-        )
-        for photo in photos
-    ]
+    # Ordered by sequence via the relationship
+    photos = session.photos
+
+    base_url = get_storage_service().get_photo_url_base()
+
+    return [PhotoResponse.from_photo(photo, base_url) for photo in photos]
 
 
 @router.get("/{session_id}/photos/{photo_id}/download")
 async def download_photo(
     session_id: str,
     photo_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> FileResponse:
+) -> Response:
     """Download full-resolution photo."""
     result = await db.execute(
         select(Photo)
@@ -74,16 +72,25 @@ async def download_photo(
 
     file_path = settings.photos_dir / photo.web_path
 
-    if not file_path.exists():
+    # Single stat, reused by FileResponse for Content-Length/Last-Modified
+    try:
+        stat_result = await asyncio.to_thread(os.stat, file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Photo file not found",
         )
 
-    filename = f"picpop_{session_id[:8]}_{photo.sequence:02d}.jpg"
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    filename = _DOWNLOAD_NAME_FMT % (session_id[:8], photo.sequence)
 
     return FileResponse(
         path=file_path,
         filename=filename,
         media_type="image/jpeg",
+        stat_result=stat_result,
+        headers={"ETag": etag},
     )
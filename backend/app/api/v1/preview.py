@@ -2,96 +2,266 @@
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import AsyncGenerator
 
-from fastapi import APIRouter
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from app.core.config import settings
 from app.services.camera import (
     get_camera,
     wait_if_paused,
     is_preview_paused,
+    CameraBusy,
     CameraError,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Multipart framing for the MJPEG stream, built once instead of per frame
+_MJPEG_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+_MJPEG_TAIL = b"\r\n"
 
-async def mjpeg_stream(fps: int = 30) -> AsyncGenerator[bytes, None]:
-    """Generate MJPEG frames from camera."""
-    camera = get_camera(settings.camera_backend)
-    frame_interval = 1.0 / fps if fps > 0 else 0
-    frame_count = 0
 
-    # Exponential backoff state
-    connect_retry_delay = 1.0
-    max_connect_retry_delay = 5.0
-    error_retry_delay = 0.5
-    max_error_retry_delay = 5.0
+@dataclass
+class _Subscriber:
+    """A stream's requested rate and when it is due its next frame."""
+
+    fps: int
+    next_due: float = 0.0
+
+
+class PreviewProducer:
+    """
+    Single camera reader shared by all MJPEG clients.
+
+    One task pulls frames from the camera at the fastest subscriber's fps and
+    fans them out to a bounded queue per subscriber, skipping frames that
+    arrive before a slower subscriber's own interval. Slow clients drop their
+    oldest frame instead of slowing the camera down, and capture cost no
+    longer scales with the number of viewers. The task starts with the first
+    subscriber and stops when the last one leaves.
+    """
+
+    def __init__(self, queue_size: int = 1) -> None:
+        self._queue_size = queue_size
+        self._subscribers: dict[asyncio.Queue[bytes | memoryview], _Subscriber] = {}
+        self._task: asyncio.Task[None] | None = None
+
+        # Most recent frame for one-shot readers, and an event set on each new one
+        self._latest: bytes | memoryview | None = None
+        self._new_frame = asyncio.Event()
+
+    def subscribe(self, fps: int) -> asyncio.Queue[bytes | memoryview]:
+        """Register a subscriber and start the producer if needed."""
+        queue: asyncio.Queue[bytes | memoryview] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers[queue] = _Subscriber(fps)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes | memoryview]) -> None:
+        """Remove a subscriber and stop the producer if it was the last one."""
+        self._subscribers.pop(queue, None)
+
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._latest = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the producer task is currently capturing."""
+        return self._task is not None and not self._task.done()
+
+    async def next_frame(self, timeout: float) -> bytes | memoryview | None:
+        """
+        Get the latest frame from the running producer.
+
+        Waits for the first frame if none has been captured yet. Returns None if
+        the producer is not running or no frame arrives in time. Doesn't
+        subscribe, so one-shot readers never affect stream pacing.
+        """
+        if not self.is_running:
+            return None
+
+        if self._latest is None:
+            try:
+                await asyncio.wait_for(self._new_frame.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
+
+        return self._latest
+
+    def _publish(self, frame: bytes | memoryview, now: float) -> None:
+        """Hand a frame to every subscriber that is due one, evicting stale frames."""
+        for queue, subscriber in self._subscribers.items():
+            if subscriber.fps > 0:
+                if now < subscriber.next_due:
+                    continue
+                # Advance on a fixed schedule so jitter doesn't lower the rate,
+                # resyncing after a stall (or the first frame) instead of bursting
+                interval = 1.0 / subscriber.fps
+                subscriber.next_due += interval
+                if subscriber.next_due <= now:
+                    subscriber.next_due = now + interval
+
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(frame)
+
+        self._latest = frame
+        new_frame, self._new_frame = self._new_frame, asyncio.Event()
+        new_frame.set()
+
+    async def _run(self) -> None:
+        """Capture loop - paced at the fastest subscriber's fps."""
+        camera = get_camera(settings.camera_backend)
+        frame_count = 0
+
+        # Exponential backoff state
+        connect_retry_delay = 1.0
+        max_connect_retry_delay = 5.0
+        error_retry_delay = 0.5
+        max_error_retry_delay = 5.0
+
+        logger.info("Starting preview producer")
+
+        # Pace against a deadline so capture time is absorbed into the frame interval
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+
+        try:
+            while True:
+                # Wait if capture is happening
+                await wait_if_paused()
+
+                # Connect if needed
+                if not camera.is_connected():
+                    connected = await camera.connect()
+                    if not connected:
+                        logger.warning(
+                            f"Camera connect failed, retrying in {connect_retry_delay:.1f}s"
+                        )
+                        # Wake early if another caller connects the camera meanwhile
+                        if not await camera.wait_connected(timeout=connect_retry_delay):
+                            # Exponential backoff for connection failures
+                            connect_retry_delay = min(
+                                connect_retry_delay * 1.5, max_connect_retry_delay
+                            )
+                        continue
+                    else:
+                        # Reset backoff on successful connection
+                        connect_retry_delay = 1.0
+                        error_retry_delay = 0.5
+
+                try:
+                    frame = await camera.get_preview_frame()
+                    frame_count += 1
+
+                    # Reset error backoff on successful frame
+                    error_retry_delay = 0.5
+
+                    if frame_count == 1:
+                        logger.info("First preview frame captured")
+                    elif frame_count % 300 == 0:
+                        logger.debug(f"Preview: {frame_count} frames")
+
+                    self._publish(frame, loop.time())
+
+                    fps = max((sub.fps for sub in self._subscribers.values()), default=0)
+                    if fps > 0:
+                        frame_interval = 1.0 / fps
+                        now = loop.time()
+                        deadline += frame_interval
+                        if deadline < now - frame_interval:
+                            # Camera stalled - resync rather than bursting to catch up
+                            deadline = now
+                        await asyncio.sleep(max(0.0, deadline - now))
+
+                except CameraBusy:
+                    # Another camera operation is in flight - skip this frame
+                    await asyncio.sleep(0.1)
+                except CameraError as e:
+                    logger.warning(
+                        f"Preview frame error: {e}, retrying in {error_retry_delay:.1f}s"
+                    )
+                    await asyncio.sleep(error_retry_delay)
+                    # Exponential backoff for preview errors
+                    error_retry_delay = min(error_retry_delay * 1.5, max_error_retry_delay)
+                except Exception as e:
+                    logger.error(
+                        f"Unexpected preview error: {e}, retrying in {error_retry_delay:.1f}s"
+                    )
+                    await asyncio.sleep(error_retry_delay)
+                    error_retry_delay = min(error_retry_delay * 1.5, max_error_retry_delay)
+
+        except asyncio.CancelledError:
+            logger.info(f"Preview producer stopped after {frame_count} frames")
+            raise
+
+
+# Shared by all preview streams
+preview_producer = PreviewProducer()
+
+# One-shot /frame grab shared by concurrent pollers while no stream is running
+_frame_in_flight: asyncio.Task[bytes | memoryview] | None = None
+
+
+async def _grab_frame_shared() -> bytes | memoryview:
+    """
+    Grab a single preview frame, coalescing concurrent callers.
+
+    Pollers that arrive while a grab is in flight await the same frame
+    instead of each issuing their own camera request.
+    """
+    global _frame_in_flight
+
+    if _frame_in_flight is None or _frame_in_flight.done():
+        camera = get_camera(settings.camera_backend)
+        _frame_in_flight = asyncio.create_task(camera.get_preview_frame())
+
+    # Shielded so one client disconnecting doesn't cancel the others' frame
+    return await asyncio.shield(_frame_in_flight)
+
+
+async def mjpeg_stream(request: Request, fps: int = 30) -> AsyncGenerator[bytes, None]:
+    """Generate MJPEG frames from the shared preview producer."""
+    queue = preview_producer.subscribe(fps)
+    frame_count = 0
 
     logger.info(f"Starting preview stream at {fps} fps")
 
     try:
         while True:
-            # Wait if capture is happening
-            await wait_if_paused()
-
-            # Connect if needed
-            if not camera.is_connected():
-                connected = await camera.connect()
-                if not connected:
-                    logger.warning(f"Camera connect failed, retrying in {connect_retry_delay:.1f}s")
-                    await asyncio.sleep(connect_retry_delay)
-                    # Exponential backoff for connection failures
-                    connect_retry_delay = min(connect_retry_delay * 1.5, max_connect_retry_delay)
-                    continue
-                else:
-                    # Reset backoff on successful connection
-                    connect_retry_delay = 1.0
-                    error_retry_delay = 0.5
+            # Check for client disconnect between frames (and while preview is
+            # paused) so the subscription is released promptly
+            if await request.is_disconnected():
+                logger.info(f"Preview client disconnected after {frame_count} frames")
+                break
 
             try:
-                frame = await camera.get_preview_frame()
-                frame_count += 1
-
-                # Reset error backoff on successful frame
-                error_retry_delay = 0.5
-
-                if frame_count == 1:
-                    logger.info("First preview frame captured")
-                elif frame_count % 300 == 0:
-                    logger.debug(f"Preview: {frame_count} frames")
-
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n"
-                    b"Content-Length: " + str(len(frame)).encode() + b"\r\n"
-                    b"\r\n" + frame + b"\r\n"
-                )
-
-                if frame_interval > 0:
-                    await asyncio.sleep(frame_interval)
-
-            except CameraError as e:
-                logger.warning(f"Preview frame error: {e}, retrying in {error_retry_delay:.1f}s")
-                await asyncio.sleep(error_retry_delay)
-                # Exponential backoff for preview errors
-                error_retry_delay = min(error_retry_delay * 1.5, max_error_retry_delay)
-            except Exception as e:
-                logger.error(f"Unexpected preview error: {e}")
-                await asyncio.sleep(0.1)
+                frame = await asyncio.wait_for(queue.get(), timeout=1.0)
+            except TimeoutError:
+                continue
+
+            frame_count += 1
+            yield b"".join((_MJPEG_HEADER % len(frame), frame, _MJPEG_TAIL))
 
     except asyncio.CancelledError:
         logger.info(f"Preview stream cancelled after {frame_count} frames")
         raise  # Re-raise to properly clean up
     finally:
+        preview_producer.unsubscribe(queue)
         logger.info("Preview stream ended")
 
 
 @router.get("/preview")
-async def preview(fps: int = 30):
+async def preview(request: Request, fps: int = 30):
     """
     Stream live camera preview as MJPEG.
 
@@ -100,7 +270,7 @@ async def preview(fps: int = 30):
     target_fps = max(1, min(fps, 60))
 
     return StreamingResponse(
-        mjpeg_stream(target_fps),
+        mjpeg_stream(request, target_fps),
         media_type="multipart/x-mixed-replace; boundary=frame",
         headers={
             "Cache-Control": "no-cache, no-store, must-revalidate",
@@ -119,7 +289,16 @@ async def single_frame():
     Use this for polling-based preview in environments where
     MJPEG streams don't work well (like Tauri WebView).
     """
-    from fastapi.responses import Response
+    frame_headers = {
+        "Cache-Control": "no-cache, no-store",
+        "Access-Control-Allow-Origin": "*",
+    }
+
+    # Share the stream's capture instead of grabbing another frame from the camera
+    if not is_preview_paused():
+        frame = await preview_producer.next_frame(timeout=1.0)
+        if frame is not None:
+            return Response(content=frame, media_type="image/jpeg", headers=frame_headers)
 
     camera = get_camera(settings.camera_backend)
 
@@ -128,15 +307,8 @@ async def single_frame():
             return Response(status_code=503, content=b"Camera not connected")
 
     try:
-        frame = await camera.get_preview_frame()
-        return Response(
-            content=frame,
-            media_type="image/jpeg",
-            headers={
-                "Cache-Control": "no-cache, no-store",
-                "Access-Control-Allow-Origin": "*",
-            },
-        )
+        frame = await _grab_frame_shared()
+        return Response(content=frame, media_type="image/jpeg", headers=frame_headers)
     except CameraError as e:
         return Response(status_code=503, content=str(e).encode())
 
@@ -145,7 +317,7 @@ async def single_frame():
 async def status():
     """Get camera status."""
     camera = get_camera(settings.camera_backend)
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "connected": camera.is_connected(),
             "previewPaused": is_preview_paused(),
@@ -158,7 +330,7 @@ async def connect():
     """Connect to camera."""
     camera = get_camera(settings.camera_backend)
     connected = await camera.connect()
-    return JSONResponse({"connected": connected})
+    return ORJSONResponse({"connected": connected})
 
 
 @router.post("/disconnect")
@@ -166,7 +338,7 @@ async def disconnect():
     """Disconnect from camera."""
     camera = get_camera(settings.camera_backend)
     await camera.disconnect()
-    return JSONResponse({"connected": False})
+    return ORJSONResponse({"connected": False})
 
 
 @router.post("/reset")
@@ -178,4 +350,4 @@ async def reset():
         await camera.disconnect()
 
     connected = await camera.connect()
-    return JSONResponse({"connected": connected})
+    return ORJSONResponse({"connected": connected})
@@ -1,19 +1,24 @@
 """Session endpoints."""
 
 import asyncio
+import hashlib
 import logging
+import os
 import secrets
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
-from sqlalchemy import select, update
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse, Response
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
 
 from app.core.config import settings
+from app.db.base import new_id
 from app.db.session import get_db
 from app.models.session import Session, SessionStatus
 from app.models.photo import Photo
@@ -23,24 +28,68 @@ from app.schemas import (
     SessionGalleryResponse,
     PhotoResponse,
 )
-from app.services import get_storage_service, generate_qr_code, generate_wifi_qr_code, ws_manager
-from app.services.storage import generate_photo_strip
+from app.services import (
+    active_session_cache,
+    get_storage_service,
+    generate_qr_code,
+    generate_wifi_qr_code,
+    ws_manager,
+    ws_messages,
+)
 from app.services.camera import get_camera, pause_preview, resume_preview, CameraError
 
 router = APIRouter()
 
+# Public session URLs - settings.public_url is fixed for the process lifetime
+_GALLERY_URL_FMT = settings.public_url + "/session/%s"
+_QR_URL_FMT = settings.public_url + "/api/v1/sessions/%s/qr"
+_WIFI_QR_URL_FMT = settings.public_url + "/api/v1/sessions/%s/wifi-qr"
+_STRIP_URL_FMT = settings.public_url + "/api/v1/sessions/%s/strip"
 
-@router.get("/wifi-qr")
-async def get_global_wifi_qr_code(size: int = 256) -> Response:
-    """Get QR code for WiFi connection (no session required)."""
-    qr_image = generate_wifi_qr_code(
-        settings.wifi_ssid, settings.wifi_password, size=min(size, 512)
+# Photos post-processed concurrently while the next countdown/capture runs
+PROCESSING_WORKERS = 2
+
+
+def _session_response(session: Session, stats: dict | None = None) -> SessionResponse:
+    """Build a SessionResponse from a session row and optional connection stats."""
+    return SessionResponse.model_construct(
+        id=session.id,
+        createdAt=session.created_at,
+        expiresAt=session.expires_at,
+        status=session.status,
+        photoCount=session.photo_count,
+        kioskConnected=stats["kiosk_connected"] if stats else False,
+        phoneConnected=stats["phone_count"] > 0 if stats else False,
     )
 
-    return Response(
-        content=qr_image,
-        media_type="image/png",
-        headers={"Cache-Control": "no-cache"},
+
+def _qr_etag(*parts: object) -> str:
+    """ETag derived from the QR inputs, so a revalidation needs no image generation."""
+    key = "\n".join(str(part) for part in parts).encode()
+    return f'"{hashlib.blake2b(key, digest_size=8).hexdigest()}"'
+
+
+def _qr_response(
+    request: Request, etag: str, cache_control: str, render: Callable[[], bytes]
+) -> Response:
+    """Return a rendered QR PNG with an ETag, or 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=render(), media_type="image/png", headers=headers)
+
+
+@router.get("/wifi-qr")
+async def get_global_wifi_qr_code(request: Request, size: int = 256) -> Response:
+    """Get QR code for WiFi connection (no session required)."""
+    size = min(size, 512)
+    return _qr_response(
+        request,
+        _qr_etag("wifi", settings.wifi_ssid, settings.wifi_password, size),
+        "public, max-age=86400, immutable",
+        lambda: generate_wifi_qr_code(settings.wifi_ssid, settings.wifi_password, size=size),
     )
 
 
@@ -71,27 +120,29 @@ async def create_session(
     This is called by the kiosk to start a new session.
     Any existing active sessions are automatically ended.
     """
-    # End existing active sessions
+    # End existing active sessions (same transaction as the insert below)
     await db.execute(
         update(Session)
         .where(Session.status.in_([SessionStatus.ACTIVE.value, SessionStatus.CAPTURING.value]))
         .values(status=SessionStatus.COMPLETED.value)
     )
-    await db.commit()
 
-    # Create new session
+    # Create new session - id and timestamps are set here so no refresh is needed
+    now = datetime.now(timezone.utc)
     session = Session(
-        expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.session_expiry_minutes),
+        id=new_id(),
+        created_at=now,
+        expires_at=now + timedelta(minutes=settings.session_expiry_minutes),
         upload_token=secrets.token_urlsafe(32),
     )
 
     db.add(session)
     await db.commit()
-    await db.refresh(session)
+    active_session_cache.invalidate()
 
-    gallery_url = f"{settings.public_url}/session/{session.id}"
-    qr_code_url = f"{settings.public_url}/api/v1/sessions/{session.id}/qr"
-    wifi_qr_url = f"{settings.public_url}/api/v1/sessions/{session.id}/wifi-qr"
+    gallery_url = _GALLERY_URL_FMT % session.id
+    qr_code_url = _QR_URL_FMT % session.id
+    wifi_qr_url = _WIFI_QR_URL_FMT % session.id
 
     return CreateSessionResponse(
         id=session.id,
@@ -117,17 +168,7 @@ async def get_session(
             detail="Session not found",
         )
 
-    stats = ws_manager.get_session_stats(session_id)
-
-    return SessionResponse(
-        id=session.id,
-        createdAt=session.created_at,
-        expiresAt=session.expires_at,
-        status=session.status,
-        photoCount=session.photo_count,
-        kioskConnected=stats["kiosk_connected"],
-        phoneConnected=stats["phone_count"] > 0,
-    )
+    return _session_response(session, ws_manager.get_session_stats(session_id))
 
 
 @router.get("/{session_id}/gallery", response_model=SessionGalleryResponse)
@@ -136,7 +177,11 @@ async def get_session_gallery(
     db: AsyncSession = Depends(get_db),
 ) -> SessionGalleryResponse:
     """Get session gallery with photos."""
-    result = await db.execute(select(Session).where(Session.id == session_id))
+    result = await db.execute(
+        select(Session)
+        .options(selectinload(Session.photos))
+        .where(Session.id == session_id)
+    )
     session = result.scalar_one_or_none()
 
     if not session:
@@ -145,40 +190,17 @@ async def get_session_gallery(
             detail="Session not found",
         )
 
-    # Get photos
-    photos_result = await db.execute(
-        select(Photo).where(Photo.session_id == session_id).order_by(Photo.sequence)
-    )
-    photos = photos_result.scalars().all()
+    # Ordered by sequence via the relationship
+    photos = session.photos
 
-    storage = get_storage_service()
-    stats = ws_manager.get_session_stats(session_id)
-
-    photo_responses = [
-        PhotoResponse(
-            id=photo.id,
-            sessionId=photo.session_id,
-            sequence=photo.sequence,
-            capturedAt=photo.captured_at,
-            webUrl=storage.get_photo_url(photo.web_path),
-            thumbnailUrl=storage.get_photo_url(photo.thumbnail_path),
-        )
-        for photo in photos
-    ]
+    base_url = get_storage_service().get_photo_url_base()
+    photo_responses = [PhotoResponse.from_photo(photo, base_url) for photo in photos]
 
-    qr_code_url = f"{settings.public_url}/api/v1/sessions/{session.id}/qr"
-    strip_url = f"{settings.public_url}/api/v1/sessions/{session.id}/strip" if photos else None
+    qr_code_url = _QR_URL_FMT % session.id
+    strip_url = _STRIP_URL_FMT % session.id if photos else None
 
     return SessionGalleryResponse(
-        session=SessionResponse(
-            id=session.id,
-            createdAt=session.created_at,
-            expiresAt=session.expires_at,
-            status=session.status,
-            photoCount=session.photo_count,
-            kioskConnected=stats["kiosk_connected"],
-            phoneConnected=stats["phone_count"] > 0,
-        ),
+        session=_session_response(session, ws_manager.get_session_stats(session_id)),
         photos=photo_responses,
         qrCodeUrl=qr_code_url,
         stripUrl=strip_url,
@@ -188,6 +210,7 @@ async def get_session_gallery(
 @router.get("/{session_id}/qr")
 async def get_session_qr_code(
     session_id: str,
+    request: Request,
     size: int = 256,
     db: AsyncSession = Depends(get_db),
 ) -> Response:
@@ -201,19 +224,20 @@ async def get_session_qr_code(
             detail="Session not found",
         )
 
-    gallery_url = f"{settings.public_url}/session/{session.id}"
-    qr_image = generate_qr_code(gallery_url, size=min(size, 512))
-
-    return Response(
-        content=qr_image,
-        media_type="image/png",
-        headers={"Cache-Control": "max-age=3600"},
+    gallery_url = _GALLERY_URL_FMT % session.id
+    size = min(size, 512)
+    return _qr_response(
+        request,
+        _qr_etag(gallery_url, size),
+        "max-age=3600",
+        lambda: generate_qr_code(gallery_url, size=size),
     )
 
 
 @router.get("/{session_id}/wifi-qr")
 async def get_wifi_qr_code(
     session_id: str,
+    request: Request,
     size: int = 256,
     db: AsyncSession = Depends(get_db),
 ) -> Response:
@@ -227,14 +251,12 @@ async def get_wifi_qr_code(
             detail="Session not found",
         )
 
-    qr_image = generate_wifi_qr_code(
-        settings.wifi_ssid, settings.wifi_password, size=min(size, 512)
-    )
-
-    return Response(
-        content=qr_image,
-        media_type="image/png",
-        headers={"Cache-Control": "max-age=3600"},
+    size = min(size, 512)
+    return _qr_response(
+        request,
+        _qr_etag("wifi", settings.wifi_ssid, settings.wifi_password, size),
+        "max-age=3600",
+        lambda: generate_wifi_qr_code(settings.wifi_ssid, settings.wifi_password, size=size),
     )
 
 
@@ -244,23 +266,25 @@ async def get_photo_strip(
     db: AsyncSession = Depends(get_db),
 ) -> Response:
     """Get photo strip image for the session."""
-    result = await db.execute(select(Session).where(Session.id == session_id))
-    session = result.scalar_one_or_none()
+    result = await db.execute(select(Session.id).where(Session.id == session_id))
 
-    if not session:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found",
         )
 
-    # Get latest photos
-    photos_result = await db.execute(
+    # Latest capture's photos - newest N by sequence, flipped back to ascending in SQL
+    latest = (
         select(Photo)
         .where(Photo.session_id == session_id)
         .order_by(Photo.sequence.desc())
         .limit(settings.photos_per_capture)
+        .subquery()
     )
-    photos = list(reversed(photos_result.scalars().all()))
+    latest_photo = aliased(Photo, latest)
+    photos_result = await db.execute(select(latest_photo).order_by(latest.c.sequence))
+    photos = photos_result.scalars().all()
 
     if not photos:
         raise HTTPException(
@@ -268,16 +292,25 @@ async def get_photo_strip(
             detail="No photos in session",
         )
 
-    photo_paths = [settings.photos_dir / photo.web_path for photo in photos]
-    strip_image = generate_photo_strip(photo_paths)
-
-    return Response(
-        content=strip_image,
+    storage = get_storage_service()
+    photo_paths = [photo.web_path for photo in photos]
+    key = photos[-1].sequence
+    strip_path = await storage.get_photo_strip(session_id, photo_paths, key)
+    try:
+        stat_result = await asyncio.to_thread(os.stat, strip_path)
+    except FileNotFoundError:
+        # A newer capture's strip replaced ours between render and serve
+        strip_path = await storage.get_photo_strip(session_id, photo_paths, key)
+        stat_result = await asyncio.to_thread(os.stat, strip_path)
+
+    # Served straight from the cache file (sendfile) rather than through Python buffers
+    return FileResponse(
+        path=strip_path,
+        stat_result=stat_result,
+        filename=f"picpop_strip_{session_id[:8]}.jpg",
+        content_disposition_type="inline",
         media_type="image/jpeg",
-        headers={
-            "Content-Disposition": f'inline; filename="picpop_strip_{session_id[:8]}.jpg"',
-            "Cache-Control": "no-cache",
-        },
+        headers={"Cache-Control": "no-cache"},
     )
 
 
@@ -287,7 +320,13 @@ async def end_session(
     db: AsyncSession = Depends(get_db),
 ) -> SessionResponse:
     """End a session explicitly."""
-    result = await db.execute(select(Session).where(Session.id == session_id))
+    # Single UPDATE ... RETURNING - the returned row is already up to date
+    result = await db.execute(
+        update(Session)
+        .where(Session.id == session_id)
+        .values(status=SessionStatus.COMPLETED.value)
+        .returning(Session)
+    )
     session = result.scalar_one_or_none()
 
     if not session:
@@ -296,22 +335,13 @@ async def end_session(
             detail="Session not found",
         )
 
-    session.status = SessionStatus.COMPLETED.value
     await db.commit()
-    await db.refresh(session)
+    active_session_cache.invalidate()
 
     # Notify all clients
     await ws_manager.send_session_ended(session_id)
 
-    return SessionResponse(
-        id=session.id,
-        createdAt=session.created_at,
-        expiresAt=session.expires_at,
-        status=session.status,
-        photoCount=session.photo_count,
-        kioskConnected=False,
-        phoneConnected=False,
-    )
+    return _session_response(session)
 
 
 @router.post("/{session_id}/capture", response_model=SessionGalleryResponse)
@@ -325,62 +355,104 @@ async def capture_photos(
     This runs the full capture sequence:
     1. Countdown (3, 2, 1) - broadcast to all clients
     2. Capture photos with delay
-    3. Stream each photo to clients as it's ready
+    3. Process photos while the next countdowns run, announcing them once stored
     4. Return final gallery
     """
-    result = await db.execute(select(Session).where(Session.id == session_id))
+    # Claim the camera atomically: flip this session to COUNTDOWN only if it can
+    # capture and no other session holds the camera. Existing photos are loaded
+    # with it so the response can be built without re-querying.
+    busy_statuses = [SessionStatus.CAPTURING.value, SessionStatus.COUNTDOWN.value]
+    busy_session = aliased(Session)
+    camera_busy = select(busy_session.id).where(busy_session.status.in_(busy_statuses)).exists()
+    result = await db.execute(
+        update(Session)
+        .where(
+            Session.id == session_id,
+            Session.status.not_in([SessionStatus.COMPLETED.value, *busy_statuses]),
+            ~camera_busy,
+        )
+        .values(status=SessionStatus.COUNTDOWN.value)
+        .returning(Session)
+        .options(selectinload(Session.photos))
+    )
     session = result.scalar_one_or_none()
 
     if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found",
-        )
+        # Error path only - find out why the claim failed
+        result = await db.execute(select(Session.status).where(Session.id == session_id))
+        current_status = result.scalar_one_or_none()
 
-    if session.status == SessionStatus.COMPLETED.value:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Session already completed",
-        )
+        if current_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found",
+            )
 
-    if session.status in [SessionStatus.CAPTURING.value, SessionStatus.COUNTDOWN.value]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Capture already in progress",
-        )
+        if current_status == SessionStatus.COMPLETED.value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Session already completed",
+            )
+
+        if current_status in busy_statuses:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Capture already in progress",
+            )
 
-    # Check camera lock
-    capturing_result = await db.execute(
-        select(Session).where(
-            Session.status.in_([SessionStatus.CAPTURING.value, SessionStatus.COUNTDOWN.value])
-        )
-    )
-    if capturing_result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Camera is busy with another session",
         )
 
-    # Check camera BEFORE starting countdown
+    # Committing returns the connection to the pool. Nothing touches the DB again
+    # until the photo batch insert, so no connection is held during countdowns,
+    # captures and processing (expire_on_commit=False keeps session usable).
+    await db.commit()
+
+    # Check camera BEFORE starting countdown, releasing the claim if it's unavailable
     camera = get_camera(settings.camera_backend)
     if not camera.is_connected():
         if not await camera.connect():
+            session.status = SessionStatus.ACTIVE.value
+            await db.commit()
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Camera not available",
             )
 
     storage = get_storage_service()
+    session_dir = settings.photos_dir / session_id
     capture_errors: list[str] = []
-    processing_tasks: list[asyncio.Task] = []
+    capture_queue: asyncio.Queue[tuple[int, int, Awaitable[Path]] | None] = asyncio.Queue(
+        maxsize=PROCESSING_WORKERS
+    )
+    processing_workers: list[asyncio.Task] = []
+    photos_queued = 0
     photos_captured: list[Photo] = []
+    # Set once the camera claim has been released (status back to ACTIVE)
+    sequence_finished = False
+
+    async def process_photo_background(
+        seq: int, photo_num: int, download: Awaitable[Path]
+    ) -> dict[str, object]:
+        """
+        Wait for a photo's download, then process it.
+
+        Returns the photo row - rows are inserted in one batch once the
+        whole sequence has been processed.
+        """
+        try:
+            path = await download
+        except Exception as e:
+            error_msg = f"Photo {photo_num} capture failed: {e}"
+            logger.error(f"[CAPTURE] {error_msg}")
+            capture_errors.append(error_msg)
+            await ws_manager.broadcast_raw(
+                session_id, ws_messages.photo_failed(session_id, photo_num, str(e))
+            )
+            raise
 
-    # Lock to safely append to photos_captured from background tasks
-    photos_lock = asyncio.Lock()
-
-    async def process_photo_background(seq: int, path: Path) -> None:
-        """Process a single photo in the background."""
-        nonlocal photos_captured
         try:
             # Process and store (runs in thread pool)
             web_path, thumb_path = await storage.process_and_store(
@@ -389,76 +461,109 @@ async def capture_photos(
                 seq,
                 save_raw=settings.save_raw_images,
             )
-
-            # Create photo record - need fresh db session for background task
-            from app.db.session import async_session_maker
-
-            async with async_session_maker() as bg_db:
-                photo = Photo(
-                    session_id=session_id,
-                    sequence=seq,
-                    web_path=web_path,
-                    thumbnail_path=thumb_path,
-                )
-                bg_db.add(photo)
-
-                # Update session photo count
-                await bg_db.execute(
-                    update(Session).where(Session.id == session_id).values(photo_count=seq)
-                )
-                await bg_db.commit()
-                await bg_db.refresh(photo)
-
-                async with photos_lock:
-                    photos_captured.append(photo)
-
-                # Notify clients
-                await ws_manager.send_photo_ready(
-                    session_id,
-                    photo.id,
-                    photo.sequence,
-                    storage.get_photo_url(photo.web_path),
-                    storage.get_photo_url(photo.thumbnail_path),
-                )
-                logger.info(f"[CAPTURE] Photo {seq} processed and ready")
-
         except Exception as e:
             error_msg = f"Photo {seq} processing failed: {e}"
             logger.error(f"[CAPTURE] {error_msg}")
             capture_errors.append(error_msg)
+            raise
+
+        logger.info(f"[CAPTURE] Photo {seq} processed")
+
+        return {
+            "id": new_id(),
+            "session_id": session_id,
+            "sequence": seq,
+            # Naive UTC, matching what SQLite hands back for stored rows, so the
+            # capture response and later gallery reads serialize identically
+            "captured_at": datetime.now(timezone.utc).replace(tzinfo=None),
+            "web_path": web_path,
+            "thumbnail_path": thumb_path,
+        }
+
+    async def processing_worker() -> list[dict[str, object]]:
+        """
+        Process captured photos from the queue until a None sentinel arrives.
+
+        Returns this worker's photo rows, so no shared list is mutated.
+        """
+        rows: list[dict[str, object]] = []
+        while True:
+            item = await capture_queue.get()
+            if item is None:
+                return rows
+            try:
+                rows.append(await process_photo_background(*item))
+            except Exception:
+                # Recorded in capture_errors - the traceback goes to the log only
+                logger.exception(f"[CAPTURE] Photo {item[0]} was not saved")
+
+    async def save_processed_photos() -> None:
+        """Wait for background processing, then insert all photo rows at once."""
+        if not processing_workers:
+            return
+
+        logger.info(f"[CAPTURE] Waiting for {photos_queued} photos to finish processing...")
+        for _ in processing_workers:
+            await capture_queue.put(None)
+        results = await asyncio.gather(*processing_workers, return_exceptions=True)
+        processing_workers.clear()
+
+        rows = [
+            row
+            for worker_rows in results
+            if not isinstance(worker_rows, BaseException)
+            for row in worker_rows
+        ]
+        if not rows:
+            return
+
+        await db.execute(insert(Photo), rows)
+        session.photo_count = max(int(row["sequence"]) for row in rows)
+        # Detached Photo objects, so responses and messages share PhotoResponse.from_photo
+        photos_captured.extend(
+            Photo(**row) for row in sorted(rows, key=lambda row: int(row["sequence"]))
+        )
+
+    async def announce_photos() -> None:
+        """
+        Notify clients of the stored photos.
+
+        Sent only once the rows are committed, so clients can fetch a photo
+        by id as soon as they hear about it.
+        """
+        base_url = storage.get_photo_url_base()
+        for photo in photos_captured:
+            await ws_manager.send_photo_ready(session_id, PhotoResponse.from_photo(photo, base_url))
 
     try:
         # Pause preview during capture sequence
         pause_preview()
 
+        # The camera stays claimed (COUNTDOWN) for the whole sequence - per-photo
+        # countdown and capture phases are only broadcast to clients, not persisted
+
+        # Post-processing overlaps the following countdowns and captures
+        processing_workers.extend(
+            asyncio.create_task(processing_worker()) for _ in range(PROCESSING_WORKERS)
+        )
+
         for i in range(settings.photos_per_capture):
             sequence = session.photo_count + i + 1
             photo_num = i + 1
             is_last_photo = i == settings.photos_per_capture - 1
 
             # Countdown before EVERY photo
-            session.status = SessionStatus.COUNTDOWN.value
-            await db.commit()
-
-            for countdown in range(settings.countdown_seconds, 0, -1):
-                await ws_manager.send_countdown(
-                    session_id, countdown, photo_num, settings.photos_per_capture
-                )
+            countdown_messages = ws_messages.countdown_ticks(
+                session_id, photo_num, settings.photos_per_capture, settings.countdown_seconds
+            )
+            for message in countdown_messages:
+                await ws_manager.broadcast_raw(session_id, message)
                 await asyncio.sleep(1)
 
             # Signal this capture is starting
-            session.status = SessionStatus.CAPTURING.value
-            await db.commit()
-            await ws_manager.broadcast_to_session(
+            await ws_manager.broadcast_raw(
                 session_id,
-                {
-                    "type": "capture_start",
-                    "data": {
-                        "sessionId": session_id,
-                        "photoNumber": photo_num,
-                        "totalPhotos": settings.photos_per_capture,
-                    },
-                },
+                ws_messages.capture_start(session_id, photo_num, settings.photos_per_capture),
             )
 
             # Capture the photo
@@ -473,16 +578,18 @@ async def capture_photos(
 
                 # Capture
                 original_filename = f"{session_id}_{sequence:02d}_original.jpg"
-                original_path = settings.photos_dir / session_id / original_filename
+                original_path = session_dir / original_filename
 
-                await camera.capture(original_path)
+                # Returns once the shutter fires - the download from the camera
+                # finishes in the background alongside the next countdown
+                download = await camera.start_capture(original_path)
                 logger.info(
                     f"[CAPTURE] Photo {photo_num} captured, starting background processing..."
                 )
 
-                # Start processing in background immediately (runs during next countdown)
-                task = asyncio.create_task(process_photo_background(sequence, original_path))
-                processing_tasks.append(task)
+                # Hand off to the processing workers (runs during next countdown)
+                await capture_queue.put((sequence, photo_num, download))
+                photos_queued += 1
 
             except (CameraError, Exception) as e:
                 # Log the error but continue with remaining photos
@@ -491,16 +598,8 @@ async def capture_photos(
                 capture_errors.append(error_msg)
 
                 # Notify clients about this specific failure
-                await ws_manager.broadcast_to_session(
-                    session_id,
-                    {
-                        "type": "photo_failed",
-                        "data": {
-                            "sessionId": session_id,
-                            "photoNumber": photo_num,
-                            "error": str(e),
-                        },
-                    },
+                await ws_manager.broadcast_raw(
+                    session_id, ws_messages.photo_failed(session_id, photo_num, str(e))
                 )
 
                 # Try to reconnect for next photo - wait for USB to settle first
@@ -511,32 +610,28 @@ async def capture_photos(
                     await camera.connect()
 
             # Give camera time to settle before next capture (except after last photo)
-            if not is_last_photo:
+            if not is_last_photo and not await camera.wait_ready(timeout=1.0):
                 await asyncio.sleep(1.0)
 
             # After last photo, signal we're processing remaining photos
-            if is_last_photo and processing_tasks:
-                await ws_manager.broadcast_to_session(
-                    session_id,
-                    {
-                        "type": "processing",
-                        "data": {"sessionId": session_id, "photoCount": len(processing_tasks)},
-                    },
+            if is_last_photo and photos_queued:
+                await ws_manager.broadcast_raw(
+                    session_id, ws_messages.processing(session_id, photos_queued)
                 )
 
-        # Wait for all background processing to complete
-        if processing_tasks:
-            logger.info(f"[CAPTURE] Waiting for {len(processing_tasks)} processing tasks...")
-            await asyncio.gather(*processing_tasks, return_exceptions=True)
+        # Wait for all background processing, then persist in one batch
+        await save_processed_photos()
 
-        # Done with capture sequence
+        # Done with capture sequence - photo rows and status commit together
         session.status = SessionStatus.ACTIVE.value
         await db.commit()
+        sequence_finished = True
+        await announce_photos()
 
         # Determine outcome
         if photos_captured:
             # At least some photos succeeded
-            strip_url = f"{settings.public_url}/api/v1/sessions/{session_id}/strip"
+            strip_url = _STRIP_URL_FMT % session_id
             await ws_manager.send_capture_complete(session_id, session.photo_count, strip_url)
             if capture_errors:
                 logger.warning(
@@ -558,8 +653,16 @@ async def capture_photos(
         raise
     except Exception as e:
         logger.exception(f"Unexpected error during capture sequence: {e}")
+        # Keep any photos that were already processed
+        try:
+            await save_processed_photos()
+        except Exception as save_err:
+            logger.error(f"[CAPTURE] Failed to save processed photos: {save_err}")
+            await db.rollback()
         session.status = SessionStatus.ACTIVE.value
         await db.commit()
+        sequence_finished = True
+        await announce_photos()
         await ws_manager.send_capture_failed(session_id, f"Unexpected error: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -569,39 +672,35 @@ async def capture_photos(
         # Always resume preview
         resume_preview()
 
-    # Get all photos
-    await db.refresh(session)
-    all_photos_result = await db.execute(
-        select(Photo).where(Photo.session_id == session_id).order_by(Photo.sequence)
-    )
-    all_photos = all_photos_result.scalars().all()
+        # Cancelled mid-sequence (shutdown, dropped request) - stop the workers
+        # awaiting downloads, and release the camera claim
+        for worker in processing_workers:
+            worker.cancel()
+        await asyncio.gather(*processing_workers, return_exceptions=True)
+        if not sequence_finished:
+            try:
+                await db.rollback()
+                await db.execute(
+                    update(Session)
+                    .where(Session.id == session_id)
+                    .values(status=SessionStatus.ACTIVE.value)
+                )
+                await db.commit()
+            except Exception:
+                logger.exception(f"[CAPTURE] Failed to release camera for session {session_id}")
 
-    stats = ws_manager.get_session_stats(session_id)
+    # Build the gallery from photos already in memory - no refresh or re-query
+    base_url = storage.get_photo_url_base()
     photo_responses = [
-        PhotoResponse(
-            id=photo.id,
-            sessionId=photo.session_id,
-            sequence=photo.sequence,
-            capturedAt=photo.captured_at,
-            webUrl=storage.get_photo_url(photo.web_path),
-            thumbnailUrl=storage.get_photo_url(photo.thumbnail_path),
-        )
-        for photo in all_photos
+        PhotoResponse.from_photo(photo, base_url)
+        for photo in (*session.photos, *photos_captured)
     ]
 
-    qr_code_url = f"{settings.public_url}/api/v1/sessions/{session.id}/qr"
-    strip_url = f"{settings.public_url}/api/v1/sessions/{session.id}/strip"
+    qr_code_url = _QR_URL_FMT % session.id
+    strip_url = _STRIP_URL_FMT % session.id
 
     return SessionGalleryResponse(
-        session=SessionResponse(
-            id=session.id,
-            createdAt=session.created_at,
-            expiresAt=session.expires_at,
-            status=session.status,
-            photoCount=session.photo_count,
-            kioskConnected=stats["kiosk_connected"],
-            phoneConnected=stats["phone_count"] > 0,
-        ),
+        session=_session_response(session, ws_manager.get_session_stats(session_id)),
         photos=photo_responses,
         qrCodeUrl=qr_code_url,
         stripUrl=strip_url,
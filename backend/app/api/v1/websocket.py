@@ -4,11 +4,13 @@ import json
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.logging import get_logger
 from app.db.session import get_db, async_session_maker
 from app.models.session import Session, SessionStatus
-from app.services import ws_manager
+from app.schemas import PhotoResponse
+from app.services import active_session_cache, get_storage_service, ws_manager
 
 logger = get_logger(__name__)
 
@@ -85,6 +87,7 @@ async def kiosk_websocket(
                     if session:
                         session.status = SessionStatus.COMPLETED.value
                         await db.commit()
+                        active_session_cache.invalidate()
 
                 await ws_manager.send_session_ended(session_id)
                 break
@@ -117,44 +120,32 @@ async def phone_websocket(
     Phones can send:
     - ping: Keep-alive
     """
-    # Verify session exists
+    # Verify session exists, loading its photos for the initial state in the same query
     async with async_session_maker() as db:
-        result = await db.execute(select(Session).where(Session.id == session_id))
+        result = await db.execute(
+            select(Session)
+            .options(selectinload(Session.photos))
+            .where(Session.id == session_id)
+        )
         session = result.scalar_one_or_none()
 
-        if not session:
-            await websocket.close(code=4004, reason="Session not found")
-            return
+    if not session:
+        await websocket.close(code=4004, reason="Session not found")
+        return
 
-        if session.status == SessionStatus.COMPLETED.value:
-            await websocket.close(code=4001, reason="Session completed")
-            return
+    if session.status == SessionStatus.COMPLETED.value:
+        await websocket.close(code=4001, reason="Session completed")
+        return
 
     phone_id = await ws_manager.connect_phone(websocket, session_id)
 
     try:
         # Send current session state
-        async with async_session_maker() as db:
-            from app.models.photo import Photo
-            from app.services import get_storage_service
-
-            photos_result = await db.execute(
-                select(Photo)
-                .where(Photo.session_id == session_id)
-                .order_by(Photo.sequence)
-            )
-            photos = photos_result.scalars().all()
-
-            storage = get_storage_service()
-            photo_data = [
-                {
-                    "id": p.id,
-                    "sequence": p.sequence,
-                    "webUrl": storage.get_photo_url(p.web_path),
-                    "thumbnailUrl": storage.get_photo_url(p.thumbnail_path),
-                }
-                for p in photos
-            ]
+        base_url = get_storage_service().get_photo_url_base()
+        photo_data = [
+            PhotoResponse.from_photo(p, base_url).model_dump(mode="json")
+            for p in session.photos
+        ]
 
         await websocket.send_json({
             "type": "session_state",
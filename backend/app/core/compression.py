@@ -0,0 +1,105 @@
+"""Response compression for text payloads."""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Already-compressed or streaming media - gzipping these burns kiosk CPU for
+# nothing and would buffer the MJPEG preview
+_UNCOMPRESSED_TYPES = ("image/", "video/", "multipart/", "text/event-stream")
+
+
+class TextGZipMiddleware:
+    """Gzip JSON/HTML responses for phones on WiFi, leaving media untouched.
+
+    The decision is made on the response's own start message, so media
+    responses stream through without being held back or buffered.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepts_gzip = "gzip" in Headers(scope=scope).get("accept-encoding", "")
+        responder = _TextGZipResponder(send, self.minimum_size, self.compresslevel, accepts_gzip)
+        await self.app(scope, receive, responder.send)
+
+
+class _TextGZipResponder:
+    """Per-response state: holds the start message until the body shows whether to compress."""
+
+    def __init__(
+        self, send: Send, minimum_size: int, compresslevel: int, accepts_gzip: bool
+    ) -> None:
+        self._send = send
+        self._minimum_size = minimum_size
+        self._compresslevel = compresslevel
+        self._accepts_gzip = accepts_gzip
+        self._start_message: Message | None = None
+        self._compressor: zlib._Compress | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if content_type.startswith(_UNCOMPRESSED_TYPES) or "content-encoding" in headers:
+                self._passthrough = True
+                await self._send(message)
+            else:
+                self._start_message = message
+            return
+
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if self._start_message is not None:
+            await self._send_first(message)
+            return
+
+        assert self._compressor is not None
+        body = self._compressor.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += self._compressor.flush()
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _send_first(self, message: Message) -> None:
+        """Send the held start message, compressing from this first body chunk on if worth it."""
+        start_message, self._start_message = self._start_message, None
+        assert start_message is not None
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        headers.add_vary_header("Accept-Encoding")
+        start_message["headers"] = headers.raw
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if (
+            message["type"] != "http.response.body"
+            or not self._accepts_gzip
+            or (not more_body and len(body) < self._minimum_size)
+        ):
+            self._passthrough = True
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        self._compressor = zlib.compressobj(self._compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        body = self._compressor.compress(body)
+        headers["Content-Encoding"] = "gzip"
+        if more_body:
+            if "content-length" in headers:
+                del headers["content-length"]
+        else:
+            body += self._compressor.flush()
+            headers["Content-Length"] = str(len(body))
+        await self._send(start_message)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
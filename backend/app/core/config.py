@@ -32,6 +32,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./picpop.db"
+    # Connection pool sizing (ignored for SQLite)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
 
     # Storage (local only for offline)
     photos_dir: Path = Path("./photos")
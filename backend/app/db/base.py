@@ -1,5 +1,9 @@
 """SQLAlchemy base class."""
 
+import os
+import time
+from uuid import UUID
+
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -7,3 +11,21 @@ class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
     pass
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    A 48-bit millisecond timestamp followed by random bits, so new primary keys
+    append to the end of the index instead of landing at random leaf pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
+
+
+def new_id() -> str:
+    """New primary key as a string."""
+    return str(uuid7())
@@ -2,16 +2,43 @@
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 from app.db.base import Base
 
+_is_sqlite = settings.database_url.startswith("sqlite")
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
+    # SQLite connections are local files - pool health checks only matter for a server DB
+    **(
+        {}
+        if _is_sqlite
+        else {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": 10,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+        }
+    ),
 )
 
+
+if _is_sqlite:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        """WAL lets gallery reads proceed while a capture commits, with fewer fsyncs."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -19,10 +46,18 @@ async_session_maker = async_sessionmaker(
 )
 
 
+def _create_missing_indexes(conn) -> None:
+    """Add indexes to tables that already existed (create_all skips those tables)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def init_db() -> None:
-    """Initialize database - create all tables."""
+    """Initialize database - create all tables and any missing indexes."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
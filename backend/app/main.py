@@ -1,5 +1,6 @@
 """PicPop Photo Booth Server - FastAPI Application"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
@@ -7,13 +8,15 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 
 from app.api.v1 import router as api_router
 from app.api.v1.captive import router as captive_router
+from app.core.compression import TextGZipMiddleware
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.session import init_db
+from app.services import generate_wifi_qr_code
 
 
 @asynccontextmanager
@@ -23,6 +26,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging()
     await init_db()
 
+    # Render the WiFi QR once up front at the default and max sizes - it's
+    # constant for the process (same call shape as the endpoints so it hits
+    # the same lru_cache entry)
+    for size in (256, 512):
+        await asyncio.to_thread(
+            generate_wifi_qr_code, settings.wifi_ssid, settings.wifi_password, size=size
+        )
+
     yield
 
     # Shutdown - release camera
@@ -39,14 +50,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning(f"Error disconnecting camera on shutdown: {e}")
 
 
+class ImmutableStaticFiles(StaticFiles):
+    """Static files whose names are never reused, so clients may cache them indefinitely."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=31536000, immutable")
+        return response
+
+
 app = FastAPI(
     title="PicPop Photo Booth API",
     description="Offline photo booth server with WebSocket support",
     version="0.1.0",
     lifespan=lifespan,
     response_model_by_alias=True,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress JSON/HTML for phones on WiFi (gallery responses repeat long URL prefixes)
+app.add_middleware(TextGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -62,14 +86,17 @@ app.include_router(api_router, prefix="/api/v1")
 # Captive portal routes (at root level for device compatibility)
 app.include_router(captive_router)
 
-# Static file serving for photos
-app.mount("/photos", StaticFiles(directory=settings.photos_dir), name="photos")
+# Static file serving for photos - filenames carry a random suffix per capture
+app.mount("/photos", ImmutableStaticFiles(directory=settings.photos_dir), name="photos")
 
 # Check if mobile app build exists and serve it
 mobile_dist = Path(__file__).parent.parent / "frontend" / "dist"
 if mobile_dist.exists():
     # Serve mobile app static files
-    app.mount("/assets", StaticFiles(directory=mobile_dist / "assets"), name="mobile-assets")
+    # Vite emits content-hashed asset filenames
+    app.mount(
+        "/assets", ImmutableStaticFiles(directory=mobile_dist / "assets"), name="mobile-assets"
+    )
 
     @app.get("/session/{session_id}")
     async def serve_mobile_app(session_id: str):
@@ -2,12 +2,11 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, new_id
 
 if TYPE_CHECKING:
     from app.models.session import Session
@@ -17,11 +16,15 @@ class Photo(Base):
     """Photo model - represents a single captured photo."""
 
     __tablename__ = "photos"
+    __table_args__ = (
+        # Serves per-session photo lists and the strip, already in sequence order
+        Index("ix_photos_session_id_sequence", "session_id", "sequence"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=new_id,
     )
     session_id: Mapped[str] = mapped_column(
         String(36),
@@ -3,12 +3,11 @@
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, new_id
 
 if TYPE_CHECKING:
     from app.models.photo import Photo
@@ -28,11 +27,15 @@ class Session(Base):
     """Photo session model - represents a single booth session."""
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Serves the captive portal's latest-active-session lookup
+        Index("ix_sessions_status_created_at", "status", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=new_id,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -55,4 +58,7 @@ class Session(Base):
         "Photo",
         back_populates="session",
         cascade="all, delete-orphan",
+        order_by="Photo.sequence",
+        # Must be eager-loaded (selectinload) - implicit lazy loads can't run under asyncio
+        lazy="raise",
     )
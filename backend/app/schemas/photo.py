@@ -1,9 +1,13 @@
 """Photo schemas."""
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from app.schemas.base import CamelModel
 
+if TYPE_CHECKING:
+    from app.models.photo import Photo
+
 
 class PhotoResponse(CamelModel):
     """Schema for photo response."""
@@ -14,3 +18,15 @@ class PhotoResponse(CamelModel):
     capturedAt: datetime
     webUrl: str
     thumbnailUrl: str
+
+    @classmethod
+    def from_photo(cls, photo: "Photo", base_url: str) -> "PhotoResponse":
+        """Build from a Photo row, skipping validation since the data comes from our DB."""
+        return cls.model_construct(
+            id=photo.id,
+            sessionId=photo.session_id,
+            sequence=photo.sequence,
+            capturedAt=photo.captured_at,
+            webUrl=f"{base_url}/{photo.web_path}",
+            thumbnailUrl=f"{base_url}/{photo.thumbnail_path}",
+        )
@@ -3,6 +3,8 @@
 from app.services.storage import StorageService, get_storage_service
 from app.services.qr_generator import generate_qr_code, generate_wifi_qr_code
 from app.services.websocket_manager import WebSocketManager, ws_manager
+from app.services import ws_messages
+from app.services.active_session import ActiveSessionCache, active_session_cache
 
 __all__ = [
     "StorageService",
@@ -11,4 +13,7 @@ __all__ = [
     "generate_wifi_qr_code",
     "WebSocketManager",
     "ws_manager",
+    "ws_messages",
+    "ActiveSessionCache",
+    "active_session_cache",
 ]
@@ -0,0 +1,44 @@
+"""Short-lived cache of the active session id.
+
+Phones fire captive portal probes in bursts when joining the WiFi, so
+concurrent hits share one DB lookup. Session start/end invalidates it.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+ACTIVE_SESSION_CACHE_TTL = 1.0
+
+
+@dataclass
+class ActiveSessionCache:
+    """The last looked-up active session id and when it was stored."""
+
+    ts: float = 0.0
+    session_id: str | None = None
+    # Bumped on every invalidation, so a lookup that raced one isn't stored
+    generation: int = 0
+    # Held while refreshing, so concurrent misses wait for one lookup
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def get(self) -> tuple[bool, str | None]:
+        """Return (hit, session_id) while the cached value is fresh."""
+        if time.monotonic() - self.ts < ACTIVE_SESSION_CACHE_TTL:
+            return True, self.session_id
+        return False, None
+
+    def store(self, session_id: str | None, generation: int) -> None:
+        """Cache a lookup result, unless the cache was invalidated since it started."""
+        if self.generation == generation:
+            self.session_id = session_id
+            self.ts = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Drop the cached active session (call when a session starts or ends)."""
+        self.ts = 0.0
+        self.generation += 1
+
+
+# Global cache instance
+active_session_cache = ActiveSessionCache()
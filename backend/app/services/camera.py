@@ -4,9 +4,16 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Awaitable, Optional
+
+try:
+    import gphoto2 as gp
+except ImportError:  # mock-only installs (e.g. dev machines without libgphoto2)
+    gp = None
 
 logger = logging.getLogger(__name__)
 
@@ -57,9 +64,65 @@ class CaptureError(CameraError):
     """Failed to capture."""
 
 
+class CameraBusy(CameraError):
+    """Camera is in use by another operation."""
+
+
+# One thread owns every libgphoto2 call - object creation and buffer access
+# included: the library expects a single caller thread, and camera I/O no
+# longer competes with to_thread work for the default pool
+_gphoto2_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gphoto2")
+
+
+async def _run_gphoto2(func, *args):
+    """Run a blocking libgphoto2 call on the camera thread."""
+    return await asyncio.get_running_loop().run_in_executor(_gphoto2_executor, func, *args)
+
+
+def _get_file_data(camera, folder: str, name: str, context) -> memoryview:
+    """Download a camera file into host memory - runs on the camera thread."""
+    camera_file = gp.CameraFile()
+    camera.file_get(folder, name, gp.GP_FILE_TYPE_NORMAL, camera_file, context)
+    # Expose the gphoto2 buffer directly rather than copying it into bytes
+    return memoryview(camera_file.get_data_and_size())
+
+
+def _capture_preview_data(camera) -> memoryview:
+    """Grab a live view frame into host memory - runs on the camera thread."""
+    return memoryview(camera.capture_preview().get_data_and_size())
+
+
+def _write_file(path: Path, data: memoryview) -> None:
+    """Write a buffer to path, creating the parent directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 class Camera(ABC):
     """Abstract camera interface."""
 
+    def __init__(self) -> None:
+        # Set while connected so waiters wake as soon as a connect succeeds
+        self._connected_event = asyncio.Event()
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the camera to connect. Returns True if connected."""
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def wait_ready(self, timeout: float = 1.0) -> bool:
+        """
+        Wait up to timeout seconds for the camera to settle after a capture.
+
+        Returns False if the backend can't report readiness, in which case the
+        caller should fall back to a fixed delay.
+        """
+        return False
+
     @abstractmethod
     async def connect(self) -> bool:
         """Connect to camera. Returns True if successful."""
@@ -72,9 +135,21 @@ class Camera(ABC):
     async def capture(self, save_path: Path) -> Path:
         """Capture photo and save to path. Returns the path."""
 
+    async def start_capture(self, save_path: Path) -> Awaitable[Path]:
+        """
+        Take a photo, returning as soon as the exposure is done.
+
+        The returned awaitable resolves to save_path once the image has been
+        downloaded and written, so callers can overlap the transfer with other
+        work. Backends without a separate download step capture fully first.
+        """
+        future: asyncio.Future[Path] = asyncio.get_running_loop().create_future()
+        future.set_result(await self.capture(save_path))
+        return future
+
     @abstractmethod
-    async def get_preview_frame(self) -> bytes:
-        """Get a single preview frame as JPEG bytes."""
+    async def get_preview_frame(self) -> bytes | memoryview:
+        """Get a single preview frame as JPEG (bytes or a zero-copy buffer view)."""
 
     @abstractmethod
     def is_connected(self) -> bool:
@@ -85,12 +160,15 @@ class GPhoto2Camera(Camera):
     """Camera using gphoto2 library."""
 
     def __init__(self) -> None:
+        super().__init__()
         self._camera = None
         self._context = None
         self._lock = asyncio.Lock()
 
     async def connect(self) -> bool:
-        import gphoto2 as gp
+        if gp is None:
+            logger.error("[CAMERA] gphoto2 is not installed")
+            return False
 
         async with self._lock:
             if self._camera is not None:
@@ -99,13 +177,16 @@ class GPhoto2Camera(Camera):
 
             try:
                 logger.info("[CAMERA] Connecting to camera...")
-                self._context = gp.Context()
-                self._camera = gp.Camera()
-                await asyncio.to_thread(self._camera.init, self._context)
+                self._context = await _run_gphoto2(gp.Context)
+                self._camera = await _run_gphoto2(gp.Camera)
+                await _run_gphoto2(self._camera.init, self._context)
 
-                summary = await asyncio.to_thread(self._camera.get_summary, self._context)
+                # Abilities come from libgphoto2's driver table - unlike
+                # get_summary this doesn't round-trip to the camera
+                abilities = await _run_gphoto2(self._camera.get_abilities)
                 _camera_stats.connect_count += 1
-                logger.info(f"[CAMERA] Connected successfully: {summary.text[:80]}...")
+                self._connected_event.set()
+                logger.info(f"[CAMERA] Connected successfully: {abilities.model}")
                 _camera_stats.log_summary()
                 return True
 
@@ -122,19 +203,21 @@ class GPhoto2Camera(Camera):
             if self._camera:
                 try:
                     logger.info("[CAMERA] Disconnecting...")
-                    await asyncio.to_thread(self._camera.exit, self._context)
+                    await _run_gphoto2(self._camera.exit, self._context)
                 except Exception as e:
                     logger.warning(f"[CAMERA] Disconnect error: {e}")
                 finally:
                     self._camera = None
                     self._context = None
+                    self._connected_event.clear()
                     _camera_stats.disconnect_count += 1
                     logger.info("[CAMERA] Disconnected")
                     _camera_stats.log_summary()
 
     async def capture(self, save_path: Path) -> Path:
-        import gphoto2 as gp
+        return await (await self.start_capture(save_path))
 
+    async def start_capture(self, save_path: Path) -> Awaitable[Path]:
         async with self._lock:
             if not self._camera:
                 raise CameraNotConnected("Camera not connected")
@@ -143,7 +226,7 @@ class GPhoto2Camera(Camera):
                 logger.info("[CAMERA] Capturing photo...")
                 start_time = time.time()
 
-                file_path = await asyncio.to_thread(
+                file_path = await _run_gphoto2(
                     self._camera.capture, gp.GP_CAPTURE_IMAGE, self._context
                 )
                 capture_time = time.time() - start_time
@@ -151,65 +234,110 @@ class GPhoto2Camera(Camera):
                     f"[CAMERA] Captured in {capture_time:.2f}s: {file_path.folder}/{file_path.name}"
                 )
 
-                # Download from camera
+            except gp.GPhoto2Error as e:
+                await self._reset_after_capture_error(e)
+                raise CaptureError(f"Capture failed: {e}")
+
+        # The shutter is done - download in the background so the caller can
+        # move on (e.g. start the next countdown) during the USB transfer
+        return asyncio.create_task(self._download(file_path, save_path))
+
+    async def _download(self, file_path, save_path: Path) -> Path:
+        """Download a captured file from the camera and write it to save_path."""
+        # Only the USB transfer needs the camera - the file is written to disk
+        # after the lock is released so previews and status checks aren't held
+        # up by SD card I/O
+        async with self._lock:
+            if not self._camera:
+                raise CameraNotConnected("Camera disconnected before download")
+
+            try:
                 download_start = time.time()
-                camera_file = gp.CameraFile()
-                await asyncio.to_thread(
-                    self._camera.file_get,
+                data = await _run_gphoto2(
+                    _get_file_data,
+                    self._camera,
                     file_path.folder,
                     file_path.name,
-                    gp.GP_FILE_TYPE_NORMAL,
-                    camera_file,
                     self._context,
                 )
 
-                save_path.parent.mkdir(parents=True, exist_ok=True)
-                await asyncio.to_thread(camera_file.save, str(save_path))
-                download_time = time.time() - download_start
+            except gp.GPhoto2Error as e:
+                await self._reset_after_capture_error(e)
+                raise CaptureError(f"Download failed: {e}")
 
-                _camera_stats.capture_count += 1
-                _camera_stats.last_capture_time = time.time()
-                logger.info(f"[CAMERA] Saved in {download_time:.2f}s: {save_path}")
-                return save_path
+        try:
+            # The image is already in host memory - write the buffer in one go
+            # instead of letting libgphoto2 reopen and chunk it out
+            await asyncio.to_thread(_write_file, save_path, data)
+        except OSError as e:
+            # Local write failure - the camera itself is fine, so no reset
+            logger.error(f"[CAMERA] Failed to save {save_path}: {e}")
+            raise CaptureError(f"Saving capture failed: {e}")
+        download_time = time.time() - download_start
+
+        _camera_stats.capture_count += 1
+        _camera_stats.last_capture_time = time.time()
+        logger.info(f"[CAMERA] Saved in {download_time:.2f}s: {save_path}")
+        return save_path
 
-            except gp.GPhoto2Error as e:
-                # Reset on any gphoto2 error - camera may be disconnected
-                _camera_stats.capture_error_count += 1
-                _camera_stats.last_error = str(e)
-                _camera_stats.last_error_time = time.time()
-                logger.error(f"[CAMERA] Capture failed, resetting camera: {e}")
-                _camera_stats.log_summary()
+    async def _reset_after_capture_error(self, error: Exception) -> None:
+        """Record a capture/download error and release the camera (lock held)."""
+        # Reset on any gphoto2 error - camera may be disconnected
+        _camera_stats.capture_error_count += 1
+        _camera_stats.last_error = str(error)
+        _camera_stats.last_error_time = time.time()
+        logger.error(f"[CAMERA] Capture failed, resetting camera: {error}")
+        _camera_stats.log_summary()
+
+        # Properly exit the camera to release USB device
+        if self._camera:
+            try:
+                await _run_gphoto2(self._camera.exit, self._context)
+            except Exception as exit_err:
+                logger.debug(f"[CAMERA] Exit during reset failed (expected): {exit_err}")
 
-                # Properly exit the camera to release USB device
-                if self._camera:
-                    try:
-                        await asyncio.to_thread(self._camera.exit, self._context)
-                    except Exception as exit_err:
-                        logger.debug(f"[CAMERA] Exit during reset failed (expected): {exit_err}")
+        self._camera = None
+        self._context = None
+        self._connected_event.clear()
 
-                self._camera = None
-                self._context = None
-                raise CaptureError(f"Capture failed: {e}")
+    async def wait_ready(self, timeout: float = 1.0) -> bool:
+        deadline = time.monotonic() + timeout
+        try:
+            # Drain pending events - a poll that times out means the camera is idle.
+            # The lock is taken per poll, not across the loop, so the background
+            # download of the previous shot can slot in between polls
+            while (remaining := deadline - time.monotonic()) > 0:
+                async with self._lock:
+                    if not self._camera:
+                        return False
+
+                    event_type, _ = await _run_gphoto2(
+                        self._camera.wait_for_event,
+                        max(1, int(min(remaining, 0.1) * 1000)),
+                        self._context,
+                    )
+                if event_type == gp.GP_EVENT_TIMEOUT:
+                    return True
+        except gp.GPhoto2Error as e:
+            logger.warning(f"[CAMERA] Ready check failed: {e}")
+            return False
+
+        # Still busy, but the full settle time has already elapsed
+        logger.debug("[CAMERA] Camera still reporting events after settle timeout")
+        return True
 
-    async def get_preview_frame(self) -> bytes:
-        import gphoto2 as gp
+    async def get_preview_frame(self) -> bytes | memoryview:
+        # A capture holds the camera for seconds - fail fast rather than queue
+        # a preview frame behind it (the caller retries or skips the frame)
+        if self._lock.locked():
+            raise CameraBusy("Camera busy")
 
         async with self._lock:
             if not self._camera:
                 raise CameraNotConnected("Camera not connected")
 
             try:
-                camera_file = await asyncio.to_thread(self._camera.capture_preview)
-                data = await asyncio.to_thread(camera_file.get_data_and_size)
-
-                _camera_stats.preview_frame_count += 1
-                _camera_stats.last_preview_time = time.time()
-
-                # Log every 100 frames
-                if _camera_stats.preview_frame_count % 100 == 0:
-                    logger.debug(f"[CAMERA] Preview frames: {_camera_stats.preview_frame_count}")
-
-                return bytes(data)
+                data = await _run_gphoto2(_capture_preview_data, self._camera)
 
             except gp.GPhoto2Error as e:
                 # Reset on any gphoto2 error - camera may be disconnected
@@ -222,100 +350,160 @@ class GPhoto2Camera(Camera):
                 # Properly exit the camera to release USB device
                 if self._camera:
                     try:
-                        await asyncio.to_thread(self._camera.exit, self._context)
+                        await _run_gphoto2(self._camera.exit, self._context)
                     except Exception as exit_err:
                         logger.debug(f"[CAMERA] Exit during reset failed (expected): {exit_err}")
 
                 self._camera = None
                 self._context = None
+                self._connected_event.clear()
                 raise CaptureError(f"Preview failed: {e}")
 
+        _camera_stats.preview_frame_count += 1
+        _camera_stats.last_preview_time = time.time()
+
+        # Log every 100 frames
+        if _camera_stats.preview_frame_count % 100 == 0:
+            logger.debug(f"[CAMERA] Preview frames: {_camera_stats.preview_frame_count}")
+
+        return data
+
     def is_connected(self) -> bool:
         return self._camera is not None
 
 
+_MOCK_COLORS = [(75, 0, 130), (138, 43, 226), (255, 20, 147), (0, 191, 255)]
+
+
+@lru_cache(maxsize=8)
+def _get_font(size: int):
+    """Load the mock overlay font once per size (falls back to PIL's default)."""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=16)
+def _text_bbox(text: str, size: int) -> tuple[int, int, int, int]:
+    """
+    Bounding box of mock overlay text, measured once per text shape.
+
+    Callers pass a representative string (digits as "0") - the font's digits
+    share one advance width, so counters and timestamps center identically.
+    """
+    from PIL import Image, ImageDraw
+
+    return ImageDraw.Draw(Image.new("RGB", (1, 1))).textbbox((0, 0), text, font=_get_font(size))
+
+
+@lru_cache(maxsize=1)
+def _mock_preview_templates() -> tuple:
+    """Mock preview backgrounds (one per color) with the viewfinder already drawn."""
+    from PIL import Image, ImageDraw
+
+    templates = []
+    for color in _MOCK_COLORS:
+        img = Image.new("RGB", (640, 480), color)
+        draw = ImageDraw.Draw(img)
+
+        # Viewfinder corners
+        for cx, cy in [(40, 40), (600, 40), (40, 440), (600, 440)]:
+            draw.line([(cx - 20, cy), (cx + 20, cy)], fill=(255, 255, 255), width=2)
+            draw.line([(cx, cy - 20), (cx, cy + 20)], fill=(255, 255, 255), width=2)
+
+        templates.append(img)
+    return tuple(templates)
+
+
 class MockCamera(Camera):
     """Mock camera for testing."""
 
     def __init__(self) -> None:
+        super().__init__()
         self._connected = False
         self._capture_count = 0
         self._preview_count = 0
 
     async def connect(self) -> bool:
         self._connected = True
+        self._connected_event.set()
         logger.info("Mock camera connected")
         return True
 
     async def disconnect(self) -> None:
         self._connected = False
+        self._connected_event.clear()
         logger.info("Mock camera disconnected")
 
-    async def capture(self, save_path: Path) -> Path:
-        from PIL import Image, ImageDraw, ImageFont
-        import random
+    async def wait_ready(self, timeout: float = 1.0) -> bool:
+        return self._connected
 
+    async def capture(self, save_path: Path) -> Path:
         if not self._connected:
             raise CameraNotConnected("Mock camera not connected")
 
         self._capture_count += 1
 
+        # PIL rendering and the JPEG write run off the event loop, like the
+        # gphoto2 calls in GPhoto2Camera
+        await asyncio.to_thread(self._render_capture, save_path, self._capture_count)
+        logger.info(f"Mock capture: {save_path}")
+
+        await asyncio.sleep(0.2)
+        return save_path
+
+    @staticmethod
+    def _render_capture(save_path: Path, capture_number: int) -> None:
+        """Render and save a mock full-size capture."""
+        from PIL import Image, ImageDraw
+        import random
+
         # Create test image
-        colors = [(75, 0, 130), (138, 43, 226), (255, 20, 147), (0, 191, 255)]
-        img = Image.new("RGB", (1920, 1280), random.choice(colors))
+        img = Image.new("RGB", (1920, 1280), random.choice(_MOCK_COLORS))
         draw = ImageDraw.Draw(img)
 
-        text = f"PicPop #{self._capture_count}"
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 96)
-        except OSError:
-            font = ImageFont.load_default()
+        text = f"PicPop #{capture_number}"
+        font = _get_font(96)
 
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = _text_bbox("PicPop #" + "0" * len(str(capture_number)), 96)
         x = (1920 - (bbox[2] - bbox[0])) // 2
         y = (1280 - (bbox[3] - bbox[1])) // 2
         draw.text((x, y), text, fill=(255, 255, 255), font=font)
 
         save_path.parent.mkdir(parents=True, exist_ok=True)
         img.save(save_path, "JPEG", quality=95)
-        logger.info(f"Mock capture: {save_path}")
-
-        await asyncio.sleep(0.2)
-        return save_path
 
     async def get_preview_frame(self) -> bytes:
-        from PIL import Image, ImageDraw, ImageFont
-        from datetime import datetime
-        import io
-
         if not self._connected:
             raise CameraNotConnected("Mock camera not connected")
 
         self._preview_count += 1
+        return await asyncio.to_thread(self._render_preview, self._preview_count)
 
-        # Create preview frame
-        colors = [(75, 0, 130), (138, 43, 226), (255, 20, 147), (0, 191, 255)]
-        img = Image.new("RGB", (640, 480), colors[self._preview_count % len(colors)])
+    @staticmethod
+    def _render_preview(frame_number: int) -> bytes:
+        """Render a mock preview frame as JPEG bytes."""
+        from PIL import ImageDraw
+        from datetime import datetime
+        import io
+
+        # Only the timestamp changes per frame - start from a pre-drawn background
+        templates = _mock_preview_templates()
+        img = templates[frame_number % len(templates)].copy()
         draw = ImageDraw.Draw(img)
 
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         text = f"PREVIEW\n{timestamp}"
+        font = _get_font(36)
 
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-        except OSError:
-            font = ImageFont.load_default()
-
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = _text_bbox("PREVIEW\n00:00:00.000", 36)
         x = (640 - (bbox[2] - bbox[0])) // 2
         y = (480 - (bbox[3] - bbox[1])) // 2
         draw.text((x, y), text, fill=(255, 255, 255), font=font, align="center")
 
-        # Viewfinder corners
-        for cx, cy in [(40, 40), (600, 40), (40, 440), (600, 440)]:
-            draw.line([(cx - 20, cy), (cx + 20, cy)], fill=(255, 255, 255), width=2)
-            draw.line([(cx, cy - 20), (cx, cy + 20)], fill=(255, 255, 255), width=2)
-
         output = io.BytesIO()
         img.save(output, format="JPEG", quality=80)
         return output.getvalue()
@@ -324,21 +512,24 @@ class MockCamera(Camera):
         return self._connected
 
 
-# Global camera instance and state
-_camera: Camera | None = None
+# Global preview state
 _preview_paused = asyncio.Event()
 _preview_paused.set()  # Not paused by default
 
 
+# Camera classes by settings.camera_backend name (anything else uses gphoto2)
+_BACKENDS: dict[str, type[Camera]] = {"mock": MockCamera, "gphoto2": GPhoto2Camera}
+
+
+@lru_cache(maxsize=4)
+def _make_camera(backend: str) -> Camera:
+    """Create the camera for a backend. Cached, so each backend has one instance."""
+    return _BACKENDS.get(backend, GPhoto2Camera)()
+
+
 def get_camera(backend: str = "gphoto2") -> Camera:
     """Get the shared camera instance."""
-    global _camera
-    if _camera is None:
-        if backend == "mock":
-            _camera = MockCamera()
-        else:
-            _camera = GPhoto2Camera()
-    return _camera
+    return _make_camera(backend)
 
 
 def pause_preview() -> None:
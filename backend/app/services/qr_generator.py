@@ -14,41 +14,54 @@ from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
 QR_VERSION = 6
 
 
-@lru_cache(maxsize=100)
-def generate_qr_code(url: str, size: int = 256) -> bytes:
-    """
-    Generate a QR code image for the given URL.
-
-    Args:
-        url: The URL to encode
-        size: The size of the QR code in pixels
-
-    Returns:
-        PNG image bytes
-    """
+@lru_cache(maxsize=32)
+def _qr_matrix(data: str) -> qrcode.QRCode:
+    """Encode data into a QR module matrix, shared by every size it's rendered at."""
     qr = qrcode.QRCode(
         version=QR_VERSION,
         error_correction=qrcode.constants.ERROR_CORRECT_M,
         box_size=10,
         border=2,
     )
-    qr.add_data(url)
+    qr.add_data(data)
     qr.make(fit=False)  # Don't auto-fit, use fixed version
+    return qr
+
 
-    img = qr.make_image(
+def _render_qr(data: str, size: int) -> bytes:
+    """Render the styled QR code for data as a size x size PNG."""
+    img = _qr_matrix(data).make_image(
         image_factory=StyledPilImage,
         module_drawer=RoundedModuleDrawer(),
     )
 
-    # Resize to requested size
-    img = img.resize((size, size))
+    # The code is pure black/white, so grayscale loses nothing and encodes
+    # about 4x faster and half the size of RGB
+    img = img.get_image().convert("L").resize((size, size))
 
-    # Convert to bytes
+    # Convert to bytes - fast zlib level: the PNG goes to the kiosk over
+    # localhost and is cached, so CPU matters more than a few KB
     output = io.BytesIO()
-    img.save(output, format="PNG")
+    img.save(output, format="PNG", compress_level=1)
     return output.getvalue()
 
 
+@lru_cache(maxsize=100)
+def generate_qr_code(url: str, size: int = 256) -> bytes:
+    """
+    Generate a QR code image for the given URL.
+
+    Args:
+        url: The URL to encode
+        size: The size of the QR code in pixels
+
+    Returns:
+        PNG image bytes
+    """
+    return _render_qr(url, size)
+
+
+@lru_cache(maxsize=100)
 def generate_wifi_qr_code(ssid: str, password: str, size: int = 256) -> bytes:
     """
     Generate a QR code for WiFi connection.
@@ -67,24 +80,4 @@ def generate_wifi_qr_code(ssid: str, password: str, size: int = 256) -> bytes:
     # WiFi QR code format: WIFI:T:WPA;S:<SSID>;P:<password>;;
     wifi_string = f"WIFI:T:WPA;S:{ssid};P:{password};;"
 
-    qr = qrcode.QRCode(
-        version=QR_VERSION,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=10,
-        border=2,
-    )
-    qr.add_data(wifi_string)
-    qr.make(fit=False)  # Don't auto-fit, use fixed version
-
-    img = qr.make_image(
-        image_factory=StyledPilImage,
-        module_drawer=RoundedModuleDrawer(),
-    )
-
-    # Resize to requested size
-    img = img.resize((size, size))
-
-    # Convert to bytes
-    output = io.BytesIO()
-    img.save(output, format="PNG")
-    return output.getvalue()
+    return _render_qr(wifi_string, size)
@@ -27,6 +27,12 @@ def process_image(
     """Process image - resize and optimize."""
     img = Image.open(io.BytesIO(image_data))
 
+    # Let the JPEG decoder downscale in the DCT domain before resampling. Asking
+    # for twice the target size (like Image.thumbnail) keeps LANCZOS quality.
+    if img.format == "JPEG" and img.width > max_width:
+        target_height = int(img.height * max_width / img.width)
+        img.draft("RGB", (max_width * 2, target_height * 2))
+
     # Convert to RGB if necessary
     if img.mode in ("RGBA", "P"):
         img = img.convert("RGB")
@@ -74,6 +80,33 @@ def _process_and_save_images(
     return original_size, web_size
 
 
+def _get_or_render_strip(session_dir: Path, photo_paths: list[Path], key: int) -> Path:
+    """Return the session's strip for key, compositing it on a cache miss - runs in thread pool.
+
+    A new capture produces a higher key, so strips with lower keys are removed
+    once the new one is written. Higher keys are left alone: a request that
+    read the photos just before a capture may finish rendering after a newer
+    request already wrote its strip.
+    """
+    strip_path = session_dir / f"strip_{key}.jpg"
+    if strip_path.exists():
+        return strip_path
+
+    strip_image = generate_photo_strip(photo_paths)
+
+    # Write atomically so concurrent requests never serve a partial file
+    tmp_path = strip_path.with_name(f"{strip_path.name}.{uuid4().hex}.tmp")
+    tmp_path.write_bytes(strip_image)
+    tmp_path.replace(strip_path)
+
+    for stale_path in session_dir.glob("strip_*.jpg"):
+        stale_key = stale_path.stem.removeprefix("strip_")
+        if stale_key.isdigit() and int(stale_key) < key:
+            stale_path.unlink(missing_ok=True)
+
+    return strip_path
+
+
 class StorageService(ABC):
     """Abstract base class for storage services."""
 
@@ -98,11 +131,31 @@ class StorageService(ABC):
         """Delete all photos for a session."""
         pass
 
+    @abstractmethod
+    async def get_photo_strip(self, session_id: str, photo_paths: list[str], key: int) -> Path:
+        """
+        Get the photo strip for the given photos, rendering it only if not cached.
+
+        Args:
+            session_id: Session the photos belong to
+            photo_paths: Stored web paths of the photos, in strip order
+            key: Cache key for this set of photos (the newest sequence)
+
+        Returns:
+            Path to the strip JPEG
+        """
+        pass
+
     @abstractmethod
     def get_photo_url(self, path: str) -> str:
         """Get public URL for a photo path."""
         pass
 
+    @abstractmethod
+    def get_photo_url_base(self) -> str:
+        """Get the URL prefix that photo paths are appended to."""
+        pass
+
 
 class LocalStorageService(StorageService):
     """Local filesystem storage service."""
@@ -164,10 +217,25 @@ class LocalStorageService(StorageService):
             shutil.rmtree(session_dir)
             logger.info("Deleted session photos", session_id=session_id)
 
+    async def get_photo_strip(self, session_id: str, photo_paths: list[str], key: int) -> Path:
+        """Get the cached photo strip, compositing it in the image thread pool on a miss."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            _image_executor,
+            _get_or_render_strip,
+            self.base_dir / session_id,
+            [self.base_dir / path for path in photo_paths],
+            key,
+        )
+
     def get_photo_url(self, path: str) -> str:
         """Get URL for a photo (relative for flexibility)."""
         return f"/photos/{path}"
 
+    def get_photo_url_base(self) -> str:
+        """Get the photo URL prefix (relative for flexibility)."""
+        return "/photos"
+
 
 def generate_photo_strip(
     photo_paths: list[Path],
@@ -215,18 +283,18 @@ def generate_photo_strip(
     content_height = header_height + total_photo_height + total_inner_padding + footer_height
     total_height = content_height + (outer_padding * 2)
 
-    # Create strip with gradient background
-    strip = Image.new("RGB", (strip_width, total_height), (255, 255, 255))
+    # Create strip with gradient background - one ramp column mapped per channel
+    # and stretched across, instead of drawing every row from Python
+    ramp = Image.linear_gradient("L").resize((1, total_height), Image.Resampling.BILINEAR)
+    channels = [
+        ramp.point(lambda v, start=start, end=end: int(start + (end - start) * v / 255))
+        for start, end in ((250, 255), (245, 240), (255, 250))
+    ]
+    strip = Image.merge("RGB", channels).resize(
+        (strip_width, total_height), Image.Resampling.NEAREST
+    )
     draw = ImageDraw.Draw(strip)
 
-    # Draw gradient background
-    for y in range(total_height):
-        ratio = y / total_height
-        r = int(250 + (255 - 250) * ratio)
-        g = int(245 + (240 - 245) * ratio)
-        b = int(255 + (250 - 255) * ratio)
-        draw.line([(0, y), (strip_width, y)], fill=(r, g, b))
-
     # Draw film strip holes
     hole_radius = 12
     hole_spacing = 72
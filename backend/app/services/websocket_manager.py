@@ -1,17 +1,24 @@
 """WebSocket connection manager for real-time communication."""
 
 import asyncio
-import json
 from typing import Any
 from uuid import uuid4
 
+import orjson
 from fastapi import WebSocket
 
 from app.core.logging import get_logger
+from app.schemas import PhotoResponse
+from app.services import ws_messages
 
 logger = get_logger(__name__)
 
 
+def _encode(message: dict[str, Any]) -> str:
+    """Serialize a message once for sending as a text frame to any number of clients."""
+    return orjson.dumps(message).decode()
+
+
 class WebSocketManager:
     """
     Manages WebSocket connections for kiosk and phone clients.
@@ -122,10 +129,14 @@ class WebSocketManager:
 
     async def _send_to_kiosk_unlocked(self, session_id: str, message: dict[str, Any]) -> bool:
         """Send to kiosk without acquiring lock (internal use)."""
+        return await self._send_raw_to_kiosk_unlocked(session_id, _encode(message))
+
+    async def _send_raw_to_kiosk_unlocked(self, session_id: str, text: str) -> bool:
+        """Send pre-serialized JSON to kiosk without acquiring lock (internal use)."""
         websocket = self._kiosk_connections.get(session_id)
         if websocket:
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(text)
                 return True
             except Exception as e:
                 logger.error("Failed to send to kiosk", session_id=session_id, error=str(e))
@@ -138,31 +149,47 @@ class WebSocketManager:
         Returns:
             Number of phones that received the message
         """
+        return await self._send_raw_to_phones(session_id, _encode(message))
+
+    async def _send_raw_to_phones(self, session_id: str, text: str) -> int:
+        """Send pre-serialized JSON to all phones connected to a session."""
         async with self._lock:
             phones = self._phone_connections.get(session_id, {})
-            sent_count = 0
+            targets = list(phones.items())
 
-            for phone_id, websocket in list(phones.items()):
-                try:
-                    await websocket.send_json(message)
+            # Fan out concurrently so one slow phone doesn't delay the rest
+            results = await asyncio.gather(
+                *(websocket.send_text(text) for _, websocket in targets),
+                return_exceptions=True,
+            )
+
+            sent_count = 0
+            for (phone_id, websocket), result in zip(targets, results, strict=True):
+                if not isinstance(result, BaseException):
                     sent_count += 1
-                except Exception as e:
-                    logger.error(
-                        "Failed to send to phone",
-                        session_id=session_id,
-                        phone_id=phone_id,
-                        error=str(e),
-                    )
-                    # Remove dead connection
-                    del phones[phone_id]
-                    self._connection_sessions.pop(websocket, None)
+                    continue
+
+                logger.error(
+                    "Failed to send to phone",
+                    session_id=session_id,
+                    phone_id=phone_id,
+                    error=str(result),
+                )
+                # Remove dead connection
+                phones.pop(phone_id, None)
+                self._connection_sessions.pop(websocket, None)
 
             return sent_count
 
     async def broadcast_to_session(self, session_id: str, message: dict[str, Any]) -> None:
         """Broadcast a message to kiosk and all phones for a session."""
-        await self.send_to_kiosk(session_id, message)
-        await self.send_to_phones(session_id, message)
+        await self.broadcast_raw(session_id, _encode(message))
+
+    async def broadcast_raw(self, session_id: str, text: str) -> None:
+        """Broadcast an already-serialized JSON message to kiosk and all phones."""
+        async with self._lock:
+            await self._send_raw_to_kiosk_unlocked(session_id, text)
+        await self._send_raw_to_phones(session_id, text)
 
     async def send_countdown(
         self, session_id: str, value: int, photo_number: int = 1, total_photos: int = 1
@@ -175,40 +202,18 @@ class WebSocketManager:
             photo_number: Which photo we're counting down for (1, 2, 3...)
             total_photos: Total photos in this capture sequence
         """
-        await self.broadcast_to_session(
-            session_id,
-            {
-                "type": "countdown",
-                "data": {
-                    "value": value,
-                    "sessionId": session_id,
-                    "photoNumber": photo_number,
-                    "totalPhotos": total_photos,
-                },
-            },
+        await self.broadcast_raw(
+            session_id, ws_messages.countdown(session_id, value, photo_number, total_photos)
         )
 
     async def send_photo_ready(
         self,
         session_id: str,
-        photo_id: str,
-        sequence: int,
-        web_url: str,
-        thumbnail_url: str,
+        photo: PhotoResponse,
     ) -> None:
         """Notify all clients that a photo is ready."""
         await self.broadcast_to_session(
-            session_id,
-            {
-                "type": "photo_ready",
-                "data": {
-                    "id": photo_id,
-                    "sessionId": session_id,
-                    "sequence": sequence,
-                    "webUrl": web_url,
-                    "thumbnailUrl": thumbnail_url,
-                },
-            },
+            session_id, {"type": "photo_ready", "data": photo.model_dump()}
         )
 
     async def send_capture_complete(
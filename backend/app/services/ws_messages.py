@@ -0,0 +1,52 @@
+"""Pre-serialized WebSocket messages sent from the capture loop.
+
+Each builder fills a JSON template instead of building and encoding a dict.
+The results are sent with ws_manager.broadcast_raw().
+"""
+
+import orjson
+
+# Session IDs are UUIDs and counts are ints, so neither needs JSON escaping
+_COUNTDOWN = (
+    '{"type":"countdown","data":'
+    '{"value":%d,"sessionId":"%s","photoNumber":%d,"totalPhotos":%d}}'
+)
+_CAPTURE_START = (
+    '{"type":"capture_start","data":'
+    '{"sessionId":"%s","photoNumber":%d,"totalPhotos":%d}}'
+)
+_PHOTO_FAILED = (
+    '{"type":"photo_failed","data":'
+    '{"sessionId":"%s","photoNumber":%d,"error":%s}}'
+)
+_PROCESSING = '{"type":"processing","data":{"sessionId":"%s","photoCount":%d}}'
+
+
+def countdown(session_id: str, value: int, photo_number: int, total_photos: int) -> str:
+    """One countdown tick before the given photo."""
+    return _COUNTDOWN % (value, session_id, photo_number, total_photos)
+
+
+def countdown_ticks(
+    session_id: str, photo_number: int, total_photos: int, seconds: int
+) -> list[str]:
+    """All countdown ticks (seconds..1) before the given photo."""
+    return [
+        countdown(session_id, value, photo_number, total_photos)
+        for value in range(seconds, 0, -1)
+    ]
+
+
+def capture_start(session_id: str, photo_number: int, total_photos: int) -> str:
+    """A capture is starting for the given photo."""
+    return _CAPTURE_START % (session_id, photo_number, total_photos)
+
+
+def photo_failed(session_id: str, photo_number: int, error: str) -> str:
+    """A single photo in the sequence failed to capture."""
+    return _PHOTO_FAILED % (session_id, photo_number, orjson.dumps(error).decode())
+
+
+def processing(session_id: str, photo_count: int) -> str:
+    """All photos are captured and the remaining ones are being processed."""
+    return _PROCESSING % (session_id, photo_count)
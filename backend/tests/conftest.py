@@ -0,0 +1,50 @@
+"""Shared fixtures - the app runs against the mock camera in a scratch directory."""
+
+import os
+import tempfile
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+# Settings are read at import time, so configure them before importing the app
+_tmp_dir = Path(tempfile.mkdtemp(prefix="picpop-tests-"))
+os.environ.update(
+    CAMERA_BACKEND="mock",
+    DATABASE_URL=f"sqlite+aiosqlite:///{_tmp_dir / 'picpop.db'}",
+    PHOTOS_DIR=str(_tmp_dir / "photos"),
+    PHOTOS_PER_CAPTURE="1",
+    COUNTDOWN_SECONDS="0",
+    CAPTURE_DELAY_SECONDS="0",
+)
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.main import app, lifespan  # noqa: E402
+
+
+@pytest.fixture
+def photos_dir() -> Path:
+    """Directory the storage service writes session photos to."""
+    return settings.photos_dir
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Async client sharing the app's event loop, so requests can interleave."""
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+@pytest.fixture
+async def session_id(client: httpx.AsyncClient) -> str:
+    """A new session with one capture already taken."""
+    response = await client.post("/api/v1/sessions")
+    assert response.status_code == 200
+    new_session_id: str = response.json()["id"]
+
+    response = await client.post(f"/api/v1/sessions/{new_session_id}/capture")
+    assert response.status_code == 200
+    return new_session_id
@@ -0,0 +1,127 @@
+"""Claiming the camera for a capture sequence, and releasing it again."""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.camera import MockCamera, get_camera
+
+
+class _HeldShutter:
+    """Patches MockCamera so captures block until released."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        capture = MockCamera.capture
+
+        async def held_capture(camera: MockCamera, save_path: Path) -> Path:
+            self.started.set()
+            await self.release.wait()
+            return await capture(camera, save_path)
+
+        monkeypatch.setattr(MockCamera, "capture", held_capture)
+
+
+@pytest.fixture
+def held_shutter(monkeypatch: pytest.MonkeyPatch) -> Iterator[_HeldShutter]:
+    shutter = _HeldShutter(monkeypatch)
+    yield shutter
+    shutter.release.set()
+
+
+async def _new_session(client: httpx.AsyncClient) -> str:
+    response = await client.post("/api/v1/sessions")
+    assert response.status_code == 200
+    session_id: str = response.json()["id"]
+    return session_id
+
+
+async def _status(client: httpx.AsyncClient, session_id: str) -> str:
+    response = await client.get(f"/api/v1/sessions/{session_id}")
+    status: str = response.json()["status"]
+    return status
+
+
+async def test_capture_blocked_while_camera_claimed(
+    client: httpx.AsyncClient, held_shutter: _HeldShutter
+) -> None:
+    """The same session gets 400 and other sessions 409 until the sequence ends."""
+    holder = await _new_session(client)
+    capture = asyncio.create_task(client.post(f"/api/v1/sessions/{holder}/capture"))
+    await held_shutter.started.wait()
+    other = await _new_session(client)
+
+    again = await client.post(f"/api/v1/sessions/{holder}/capture")
+    busy = await client.post(f"/api/v1/sessions/{other}/capture")
+
+    assert again.status_code == 400
+    assert again.json()["detail"] == "Capture already in progress"
+    assert busy.status_code == 409
+    assert await _status(client, holder) == "countdown"
+
+    held_shutter.release.set()
+    assert (await capture).status_code == 200
+    assert await _status(client, holder) == "active"
+    assert (await client.post(f"/api/v1/sessions/{other}/capture")).status_code == 200
+
+
+async def test_capture_rejected_for_completed_session(client: httpx.AsyncClient) -> None:
+    session_id = await _new_session(client)
+    assert (await client.post(f"/api/v1/sessions/{session_id}/end")).status_code == 200
+
+    response = await client.post(f"/api/v1/sessions/{session_id}/capture")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Session already completed"
+    assert await _status(client, session_id) == "completed"
+
+
+async def test_capture_unknown_session(client: httpx.AsyncClient) -> None:
+    response = await client.post("/api/v1/sessions/missing/capture")
+
+    assert response.status_code == 404
+
+
+async def test_camera_unavailable_releases_claim(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A 503 for a missing camera leaves the session free to capture later."""
+    session_id = await _new_session(client)
+    await get_camera("mock").disconnect()
+
+    async def no_camera(_camera: MockCamera) -> bool:
+        return False
+
+    monkeypatch.setattr(MockCamera, "connect", no_camera)
+
+    response = await client.post(f"/api/v1/sessions/{session_id}/capture")
+
+    assert response.status_code == 503
+    assert await _status(client, session_id) == "active"
+
+    monkeypatch.undo()
+    assert (await client.post(f"/api/v1/sessions/{session_id}/capture")).status_code == 200
+
+
+async def test_cancelled_capture_releases_claim(
+    client: httpx.AsyncClient, held_shutter: _HeldShutter
+) -> None:
+    """Cancelling mid-sequence puts the session back to active with no photos."""
+    session_id = await _new_session(client)
+    capture = asyncio.create_task(client.post(f"/api/v1/sessions/{session_id}/capture"))
+    await held_shutter.started.wait()
+
+    capture.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await capture
+
+    response = await client.get(f"/api/v1/sessions/{session_id}")
+    assert response.json()["status"] == "active"
+    assert response.json()["photoCount"] == 0
+
+    held_shutter.release.set()
+    assert (await client.post(f"/api/v1/sessions/{session_id}/capture")).status_code == 200
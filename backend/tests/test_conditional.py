@@ -0,0 +1,80 @@
+"""ETag revalidation for QR codes and photo downloads."""
+
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+@pytest.mark.parametrize("path", ["qr", "wifi-qr"])
+async def test_session_qr_revalidates(
+    client: httpx.AsyncClient, session_id: str, path: str
+) -> None:
+    """A matching If-None-Match gets an empty 304 with the same ETag."""
+    url = f"/api/v1/sessions/{session_id}/{path}"
+    response = await client.get(url)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    etag = response.headers["etag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+async def test_qr_etag_mismatch_renders(client: httpx.AsyncClient, session_id: str) -> None:
+    """A stale ETag gets the full image again."""
+    url = f"/api/v1/sessions/{session_id}/qr"
+    etag = (await client.get(url)).headers["etag"]
+
+    response = await client.get(url, headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+    assert response.content.startswith(b"\x89PNG")
+
+
+async def test_qr_etag_follows_inputs(client: httpx.AsyncClient, session_id: str) -> None:
+    """ETags differ per size and per session, and repeat for the same inputs."""
+    url = f"/api/v1/sessions/{session_id}/qr"
+    small = (await client.get(url, params={"size": 128})).headers["etag"]
+    default = (await client.get(url)).headers["etag"]
+    other_session = (await client.post("/api/v1/sessions")).json()["id"]
+    other = (await client.get(f"/api/v1/sessions/{other_session}/qr")).headers["etag"]
+
+    assert len({small, default, other}) == 3
+    assert (await client.get(url)).headers["etag"] == default
+
+
+async def test_download_etag_from_file_stat(
+    client: httpx.AsyncClient, session_id: str, photos_dir: Path
+) -> None:
+    """The download ETag is mtime+size, and changes when the file does."""
+    photo = (await client.get(f"/api/v1/sessions/{session_id}/photos")).json()[0]
+    url = f"/api/v1/sessions/{session_id}/photos/{photo['id']}/download"
+    file_path = photos_dir / photo["webUrl"].removeprefix("/photos/")
+    stat_result = os.stat(file_path)
+
+    response = await client.get(url)
+
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag == f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    assert len(response.content) == stat_result.st_size
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    # A rewritten file invalidates the old ETag
+    os.utime(file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,83 @@
+"""Photo strip caching across capture boundaries."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.storage import LocalStorageService
+
+
+async def _capture(client: httpx.AsyncClient, session_id: str) -> None:
+    response = await client.post(f"/api/v1/sessions/{session_id}/capture")
+    assert response.status_code == 200
+
+
+def _strip_names(photos_dir: Path, session_id: str) -> list[str]:
+    return sorted(path.name for path in (photos_dir / session_id).glob("strip_*.jpg"))
+
+
+async def test_strip_served_after_newer_capture_removes_it(
+    client: httpx.AsyncClient, session_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A strip superseded between render and serve is re-rendered, not a 500."""
+    get_photo_strip = LocalStorageService.get_photo_strip
+    raced = False
+
+    async def render_then_capture(
+        storage: LocalStorageService, session_id: str, photo_paths: list[str], key: int
+    ) -> Path:
+        nonlocal raced
+        strip_path = await get_photo_strip(storage, session_id, photo_paths, key)
+        if not raced:
+            raced = True
+            # Another phone captures and fetches the newer strip before this one is served
+            await _capture(client, session_id)
+            newer = await client.get(f"/api/v1/sessions/{session_id}/strip")
+            assert newer.status_code == 200
+        return strip_path
+
+    monkeypatch.setattr(LocalStorageService, "get_photo_strip", render_then_capture)
+
+    response = await client.get(f"/api/v1/sessions/{session_id}/strip")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.content
+
+
+async def test_late_strip_render_keeps_newer_strip(
+    client: httpx.AsyncClient,
+    session_id: str,
+    photos_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A request that renders an older strip last doesn't delete the newer one."""
+    get_photo_strip = LocalStorageService.get_photo_strip
+    raced = False
+
+    async def capture_then_render(
+        storage: LocalStorageService, session_id: str, photo_paths: list[str], key: int
+    ) -> Path:
+        nonlocal raced
+        if not raced:
+            raced = True
+            # A capture and a newer strip request land before this one renders
+            await _capture(client, session_id)
+            newer = await client.get(f"/api/v1/sessions/{session_id}/strip")
+            assert newer.status_code == 200
+        return await get_photo_strip(storage, session_id, photo_paths, key)
+
+    monkeypatch.setattr(LocalStorageService, "get_photo_strip", capture_then_render)
+
+    response = await client.get(f"/api/v1/sessions/{session_id}/strip")
+
+    assert response.status_code == 200
+    assert _strip_names(photos_dir, session_id) == ["strip_1.jpg", "strip_2.jpg"]
+
+    # The leftover older strip goes once the next capture's strip is written
+    await _capture(client, session_id)
+    response = await client.get(f"/api/v1/sessions/{session_id}/strip")
+
+    assert response.status_code == 200
+    assert _strip_names(photos_dir, session_id) == ["strip_3.jpg"]